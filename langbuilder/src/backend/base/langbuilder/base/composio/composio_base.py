@@ -22,6 +22,20 @@ from langbuilder.schema.dataframe import DataFrame
 from langbuilder.schema.message import Message
 
 
+class LazyInputs:
+    """Class attribute that builds a component's inputs on first access.
+
+    Components declare ``inputs = LazyInputs()`` and implement a ``_build_inputs`` classmethod. The input
+    objects are only constructed when the class is first introspected or instantiated, and the resulting
+    list then replaces the descriptor on the class.
+    """
+
+    def __get__(self, instance: Any, owner: type) -> list:
+        inputs = owner._build_inputs()
+        owner.inputs = inputs
+        return inputs
+
+
 class ComposioBaseComponent(Component):
     """Base class for Composio components with common functionality."""
 
@@ -64,6 +78,7 @@ class ComposioBaseComponent(Component):
     _bool_variables: set[str] = set()
     _actions_data: dict[str, dict[str, Any]] = {}
     _default_tools: set[str] = set()
+    _virtual_actions: set[str] = set()
     _display_to_key_map: dict[str, str] = {}
     _key_to_display_map: dict[str, str] = {}
     _sanitized_names: dict[str, str] = {}
@@ -277,7 +292,9 @@ class ComposioBaseComponent(Component):
             raise ValueError(msg) from e
 
     def configure_tools(self, toolset: ComposioToolSet) -> list[Tool]:
-        tools = toolset.get_tools(actions=self._actions_data.keys())
+        tools = toolset.get_tools(
+            actions=[action for action in self._actions_data if action not in self._virtual_actions]
+        )
         logger.info(f"Tools: {tools}")
         configured_tools = []
         for tool in tools:
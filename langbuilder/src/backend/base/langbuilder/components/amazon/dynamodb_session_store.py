@@ -7,10 +7,14 @@ analytics, and session resumption capabilities.
 Adapted for LangBuilder 1.65 (CloudGeometry fork)
 """
 
+import hashlib
+import threading
 import time
 import uuid
-from datetime import datetime, timedelta
+from functools import cache
 
+import orjson
+from cachetools import LRUCache
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
@@ -28,6 +32,51 @@ AWS_REGIONS = [
     "ap-southeast-2", "sa-east-1"
 ]
 
+# Low-level DynamoDB clients keyed by (region, credentials hash, table name).
+# Building a boto3 client and checking the table costs botocore loader work and a
+# DescribeTable round trip, so both are done once per process instead of per call.
+# Clients (unlike boto3 resources) are thread-safe, so one can serve every worker
+# thread running the tool. Bounded so rotating credentials cannot grow it forever.
+_CLIENT_CACHE: LRUCache = LRUCache(maxsize=32)
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _client_cache_key(region: str, credentials: tuple[str, ...], table_name: str) -> tuple:
+    """Build a client cache key without keeping the raw credentials in memory."""
+    credentials_hash = hashlib.blake2b("\0".join(credentials).encode(), digest_size=16).digest()
+    return (region, credentials_hash, table_name)
+
+
+@cache
+def _load_boto3():
+    """Import boto3 and its ClientError once per process."""
+    try:
+        import boto3
+        from botocore.exceptions import ClientError
+    except ImportError as e:
+        msg = (
+            "boto3 is not installed. Please install it using: "
+            "uv pip install boto3"
+        )
+        raise ImportError(msg) from e
+    return boto3, ClientError
+
+
+@cache
+def _serializer():
+    """Converter from Python values to DynamoDB attribute values for the low-level client."""
+    from boto3.dynamodb.types import TypeSerializer
+
+    return TypeSerializer()
+
+
+@cache
+def _retry_config():
+    """Retry throttling and transient 5xx errors with jittered exponential backoff."""
+    from botocore.config import Config
+
+    return Config(retries={"max_attempts": 5, "mode": "standard"})
+
 
 class DynamoDBSessionStoreComponent(LCToolComponent):
     """
@@ -136,26 +185,21 @@ class DynamoDBSessionStoreComponent(LCToolComponent):
 
     # Uses default outputs from LCToolComponent base class
 
-    def _ensure_table_exists(self, dynamodb, table):
+    def _ensure_table_exists(self, client) -> None:
         """
         Check if DynamoDB table exists, create it if not.
 
         Args:
-            dynamodb: boto3 DynamoDB resource
-            table: DynamoDB Table object
-
-        Returns:
-            DynamoDB Table object (existing or newly created)
+            client: boto3 low-level DynamoDB client
         """
-        from botocore.exceptions import ClientError
+        _, client_error = _load_boto3()
 
         try:
             # Try to get table status - this will fail if table doesn't exist
-            table.load()
-            self.log(f"Table {self.table_name} exists (status: {table.table_status})")
-            return table
+            table_status = client.describe_table(TableName=self.table_name)["Table"]["TableStatus"]
+            self.log(f"Table {self.table_name} exists (status: {table_status})")
 
-        except ClientError as e:
+        except client_error as e:
             error_code = e.response.get("Error", {}).get("Code", "")
 
             if error_code == "ResourceNotFoundException":
@@ -163,7 +207,7 @@ class DynamoDBSessionStoreComponent(LCToolComponent):
 
                 # Create the table
                 try:
-                    new_table = dynamodb.create_table(
+                    client.create_table(
                         TableName=self.table_name,
                         KeySchema=[
                             {"AttributeName": "session_id", "KeyType": "HASH"}
@@ -176,12 +220,11 @@ class DynamoDBSessionStoreComponent(LCToolComponent):
 
                     # Wait for table to be created
                     self.log(f"Waiting for table {self.table_name} to be created...")
-                    new_table.wait_until_exists()
+                    client.get_waiter("table_exists").wait(TableName=self.table_name)
                     self.log(f"Table {self.table_name} created successfully")
 
                     # Enable TTL on the table
                     try:
-                        client = dynamodb.meta.client
                         client.update_time_to_live(
                             TableName=self.table_name,
                             TimeToLiveSpecification={
@@ -193,8 +236,6 @@ class DynamoDBSessionStoreComponent(LCToolComponent):
                     except Exception as ttl_error:
                         self.log(f"Warning: Could not enable TTL: {ttl_error}")
 
-                    return new_table
-
                 except Exception as create_error:
                     msg = f"Failed to create table {self.table_name}: {create_error}"
                     self.log(f"Error: {msg}")
@@ -211,15 +252,7 @@ class DynamoDBSessionStoreComponent(LCToolComponent):
             Data object with confirmation and stored data
         """
         # Import boto3 (raises ImportError if not installed)
-        try:
-            import boto3
-            from botocore.exceptions import ClientError
-        except ImportError as e:
-            msg = (
-                "boto3 is not installed. Please install it using: "
-                "uv pip install boto3"
-            )
-            raise ImportError(msg) from e
+        boto3, client_error = _load_boto3()
 
         # Extract data from structured_data input
         data = self.structured_data
@@ -234,39 +267,48 @@ class DynamoDBSessionStoreComponent(LCToolComponent):
         else:
             output_data = {}
 
-        # Initialize DynamoDB client
-        try:
-            # Use credentials if provided, otherwise use IAM role or environment
-            if self.aws_access_key_id and self.aws_secret_access_key:
-                client_kwargs = {
-                    "region_name": self.region_name,
-                    "aws_access_key_id": self.aws_access_key_id,
-                    "aws_secret_access_key": self.aws_secret_access_key,
-                }
-                # Add session token if provided (for temporary credentials)
-                if self.aws_session_token:
-                    client_kwargs["aws_session_token"] = self.aws_session_token
-                    self.log("Using temporary session credentials")
+        # Initialize DynamoDB client (cached per region, credentials and table)
+        cache_key = _client_cache_key(
+            self.region_name,
+            (self.aws_access_key_id or "", self.aws_secret_access_key or "", self.aws_session_token or ""),
+            self.table_name,
+        )
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(cache_key)
+        if client is None:
+            try:
+                # Use credentials if provided, otherwise use IAM role or environment
+                if self.aws_access_key_id and self.aws_secret_access_key:
+                    client_kwargs = {
+                        "region_name": self.region_name,
+                        "aws_access_key_id": self.aws_access_key_id,
+                        "aws_secret_access_key": self.aws_secret_access_key,
+                    }
+                    # Add session token if provided (for temporary credentials)
+                    if self.aws_session_token:
+                        client_kwargs["aws_session_token"] = self.aws_session_token
+                        self.log("Using temporary session credentials")
+                    else:
+                        self.log("Using provided AWS credentials")
+                    client = boto3.client("dynamodb", config=_retry_config(), **client_kwargs)
                 else:
-                    self.log("Using provided AWS credentials")
-                dynamodb = boto3.resource("dynamodb", **client_kwargs)
-            else:
-                dynamodb = boto3.resource("dynamodb", region_name=self.region_name)
-                self.log("Using IAM role or environment credentials")
+                    client = boto3.client("dynamodb", region_name=self.region_name, config=_retry_config())
+                    self.log("Using IAM role or environment credentials")
 
-            # Check if table exists, create if needed
-            table = dynamodb.Table(self.table_name)
+                # Check if table exists, create if needed
+                if self.auto_create_table:
+                    self._ensure_table_exists(client)
 
-            if self.auto_create_table:
-                table = self._ensure_table_exists(dynamodb, table)
+            except Exception as e:
+                msg = f"Failed to initialize DynamoDB client: {e}"
+                raise ValueError(msg) from e
 
-        except Exception as e:
-            msg = f"Failed to initialize DynamoDB client: {e}"
-            raise ValueError(msg) from e
+            with _CLIENT_CACHE_LOCK:
+                _CLIENT_CACHE[cache_key] = client
 
         # Calculate TTL timestamp
-        now = datetime.utcnow()
-        ttl_timestamp = int((now + timedelta(days=self.ttl_days)).timestamp())
+        now = time.time()
+        ttl_timestamp = int(now + self.ttl_days * 86400)
 
         # Get session_id - priority order:
         # 1. From session_id input (if it's a string)
@@ -297,7 +339,7 @@ class DynamoDBSessionStoreComponent(LCToolComponent):
         # Prepare item to save - base required fields
         item = {
             "session_id": session_id,  # Primary key
-            "timestamp": now.isoformat(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)),
             "ttl": ttl_timestamp,  # DynamoDB TTL attribute
             "user_message": str(self.user_message),
         }
@@ -315,12 +357,17 @@ class DynamoDBSessionStoreComponent(LCToolComponent):
 
         # Put item to DynamoDB
         try:
-            table.put_item(Item=item)
+            serialize = _serializer().serialize
+            client.put_item(TableName=self.table_name, Item={key: serialize(value) for key, value in item.items()})
             self.log(f"Session {session_id} stored successfully")
 
-        except ClientError as e:
+        except client_error as e:
             error_code = e.response["Error"]["Code"]
             error_msg = e.response["Error"]["Message"]
+            if error_code == "ResourceNotFoundException":
+                # The table was deleted since it was cached; look it up (and recreate it) next time
+                with _CLIENT_CACHE_LOCK:
+                    _CLIENT_CACHE.pop(cache_key, None)
             msg = f"DynamoDB error ({error_code}): {error_msg}"
             self.log(f"Error: {msg}")
             raise ValueError(msg) from e
@@ -397,13 +444,11 @@ class DynamoDBSessionStoreComponent(LCToolComponent):
             company: str = ""
         ) -> str:
             """Tool function that stores full conversation state."""
-            import json as json_module
-
             # Parse answers if it's a JSON string
             answers_dict = {}
             if answers:
                 try:
-                    answers_dict = json_module.loads(answers)
+                    answers_dict = orjson.loads(answers)
                 except:
                     answers_dict = {"raw": answers}
 
@@ -11,6 +11,7 @@ Supports: Jira Cloud, Confluence Cloud, Server/Data Center
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 from typing import TYPE_CHECKING, Any
 
@@ -403,45 +404,54 @@ class AtlassianMCPComponent(LCToolComponent):
         Returns:
             Data object with tool execution result
         """
+        # Parse tool arguments
+        arguments = {}
+        if self.tool_arguments:
+            try:
+                arguments = json.loads(self.tool_arguments)
+            except json.JSONDecodeError as e:
+                self.status = "Error: invalid_json"
+                return Data(data={
+                    "success": False,
+                    "error": f"Invalid JSON in tool arguments: {e}",
+                    "error_code": "invalid_json",
+                })
+        return asyncio.run(self._arun_model(self.tool_name, arguments))
+
+    async def _arun_model(self, tool_name: str, arguments: dict) -> Data:
+        """Execute an Atlassian MCP tool on the running event loop.
+
+        The tool and its arguments are parameters rather than component state,
+        so concurrent tool calls on one component cannot overwrite each other.
+        """
         try:
-            # Parse tool arguments
-            arguments = {}
-            if self.tool_arguments:
-                try:
-                    arguments = json.loads(self.tool_arguments)
-                except json.JSONDecodeError as e:
-                    self.status = "Error: invalid_json"
-                    return Data(data={
-                        "success": False,
-                        "error": f"Invalid JSON in tool arguments: {e}",
-                        "error_code": "invalid_json",
-                    })
+            arguments = dict(arguments)
 
             # Apply email substitution for search queries
-            if self.tool_name == "jira_search" and "jql" in arguments:
+            if tool_name == "jira_search" and "jql" in arguments:
                 original_jql = arguments["jql"]
                 arguments["jql"] = self._substitute_user_email(original_jql)
                 if arguments["jql"] != original_jql:
                     logger.info(f"JQL substitution: {original_jql} -> {arguments['jql']}")
 
-            if self.tool_name == "confluence_search" and "cql" in arguments:
+            if tool_name == "confluence_search" and "cql" in arguments:
                 original_cql = arguments["cql"]
                 arguments["cql"] = self._substitute_user_email(original_cql)
                 if arguments["cql"] != original_cql:
                     logger.info(f"CQL substitution: {original_cql} -> {arguments['cql']}")
 
             # Apply limit to search operations (MCP server uses 'limit' not 'maxResults')
-            if "search" in self.tool_name and "limit" not in arguments:
+            if "search" in tool_name and "limit" not in arguments:
                 arguments["limit"] = self.max_results
 
             # Execute MCP tool
-            self.status = f"Executing {self.tool_name}..."
-            result = asyncio.run(self._call_mcp_tool(self.tool_name, arguments))
+            self.status = f"Executing {tool_name}..."
+            result = await self._call_mcp_tool(tool_name, arguments)
 
-            self.status = f"Completed {self.tool_name}"
+            self.status = f"Completed {tool_name}"
             return Data(data={
                 "success": True,
-                "tool": self.tool_name,
+                "tool": tool_name,
                 "result": result,
                 "user_context": {
                     "slack_user_id": self.slack_user_id,
@@ -493,15 +503,22 @@ Examples:
 - "bugs I created" → reporter = "{self.slack_user_email}"
 You can also use {{user_email}} placeholder which will be auto-substituted."""
 
+        def _run_sync(coroutine_function):
+            """Sync entry point for callers that cannot await the tool coroutine."""
+
+            @functools.wraps(coroutine_function)
+            def wrapper(*args, **kwargs):
+                return asyncio.run(coroutine_function(*args, **kwargs))
+
+            return wrapper
+
         # Jira Search Tool
         class JiraSearchInput(BaseModel):
             jql: str = Field(description="JQL query string (e.g., 'project = PROJ AND status = Open')")
             max_results: int = Field(default=50, description="Maximum results to return")
 
-        def _jira_search(jql: str, max_results: int = 50) -> str:
-            self.tool_name = "jira_search"
-            self.tool_arguments = json.dumps({"jql": jql, "limit": max_results})
-            result = self.run_model()
+        async def _jira_search(jql: str, max_results: int = 50) -> str:
+            result = await self._arun_model("jira_search", {"jql": jql, "limit": max_results})
             if result.data.get("error"):
                 return f"Error: {result.data['error']}"
             return json.dumps(result.data.get("result", {}), indent=2)
@@ -518,7 +535,8 @@ Common JQL patterns:
 - type = Bug - Issues by type
 - created >= -7d - Recent issues{email_context}""",
             args_schema=JiraSearchInput,
-            func=_jira_search,
+            func=_run_sync(_jira_search),
+            coroutine=_jira_search,
             return_direct=False,
             tags=["atlassian_jira_search"],
         )
@@ -527,10 +545,8 @@ Common JQL patterns:
         class JiraGetIssueInput(BaseModel):
             issue_key: str = Field(description="Jira issue key (e.g., PROJ-123)")
 
-        def _jira_get_issue(issue_key: str) -> str:
-            self.tool_name = "jira_get_issue"
-            self.tool_arguments = json.dumps({"issueKey": issue_key})
-            result = self.run_model()
+        async def _jira_get_issue(issue_key: str) -> str:
+            result = await self._arun_model("jira_get_issue", {"issueKey": issue_key})
             if result.data.get("error"):
                 return f"Error: {result.data['error']}"
             return json.dumps(result.data.get("result", {}), indent=2)
@@ -539,7 +555,8 @@ Common JQL patterns:
             name="atlassian_jira_get_issue",
             description="Get details of a specific Jira issue by key (e.g., PROJ-123).",
             args_schema=JiraGetIssueInput,
-            func=_jira_get_issue,
+            func=_run_sync(_jira_get_issue),
+            coroutine=_jira_get_issue,
             return_direct=False,
             tags=["atlassian_jira_get_issue"],
         )
@@ -551,20 +568,18 @@ Common JQL patterns:
             issue_type: str = Field(default="Task", description="Issue type (Task, Bug, Story, etc.)")
             description: str = Field(default="", description="Issue description")
 
-        def _jira_create_issue(
+        async def _jira_create_issue(
             project_key: str,
             summary: str,
             issue_type: str = "Task",
             description: str = "",
         ) -> str:
-            self.tool_name = "jira_create_issue"
-            self.tool_arguments = json.dumps({
+            result = await self._arun_model("jira_create_issue", {
                 "projectKey": project_key,
                 "summary": summary,
                 "issueType": issue_type,
                 "description": description,
             })
-            result = self.run_model()
             if result.data.get("error"):
                 return f"Error: {result.data['error']}"
             return json.dumps(result.data.get("result", {}), indent=2)
@@ -573,7 +588,8 @@ Common JQL patterns:
             name="atlassian_jira_create_issue",
             description="Create a new Jira issue in a project.",
             args_schema=JiraCreateIssueInput,
-            func=_jira_create_issue,
+            func=_run_sync(_jira_create_issue),
+            coroutine=_jira_create_issue,
             return_direct=False,
             tags=["atlassian_jira_create_issue"],
         )
@@ -583,10 +599,8 @@ Common JQL patterns:
             cql: str = Field(description="CQL query string (e.g., 'space = SPACE AND type = page')")
             max_results: int = Field(default=25, description="Maximum results to return")
 
-        def _confluence_search(cql: str, max_results: int = 25) -> str:
-            self.tool_name = "confluence_search"
-            self.tool_arguments = json.dumps({"cql": cql, "limit": max_results})
-            result = self.run_model()
+        async def _confluence_search(cql: str, max_results: int = 25) -> str:
+            result = await self._arun_model("confluence_search", {"cql": cql, "limit": max_results})
             if result.data.get("error"):
                 return f"Error: {result.data['error']}"
             return json.dumps(result.data.get("result", {}), indent=2)
@@ -602,7 +616,8 @@ Common CQL patterns:
 - type = page - Only pages (not blogs)
 - title ~ "keyword" - Title contains keyword{email_context}""",
             args_schema=ConfluenceSearchInput,
-            func=_confluence_search,
+            func=_run_sync(_confluence_search),
+            coroutine=_confluence_search,
             return_direct=False,
             tags=["atlassian_confluence_search"],
         )
@@ -611,10 +626,8 @@ Common CQL patterns:
         class ConfluenceGetPageInput(BaseModel):
             page_id: str = Field(description="Confluence page ID")
 
-        def _confluence_get_page(page_id: str) -> str:
-            self.tool_name = "confluence_get_page"
-            self.tool_arguments = json.dumps({"pageId": page_id})
-            result = self.run_model()
+        async def _confluence_get_page(page_id: str) -> str:
+            result = await self._arun_model("confluence_get_page", {"pageId": page_id})
             if result.data.get("error"):
                 return f"Error: {result.data['error']}"
             return json.dumps(result.data.get("result", {}), indent=2)
@@ -623,7 +636,8 @@ Common CQL patterns:
             name="atlassian_confluence_get_page",
             description="Get content of a specific Confluence page by ID.",
             args_schema=ConfluenceGetPageInput,
-            func=_confluence_get_page,
+            func=_run_sync(_confluence_get_page),
+            coroutine=_confluence_get_page,
             return_direct=False,
             tags=["atlassian_confluence_get_page"],
         )
@@ -0,0 +1,33 @@
+"""Shared OpenAI clients for the CloudGeometry Pinecone tools.
+
+Reusing one client per API key keeps its HTTP connection pool warm across
+embedding calls. The cache is bounded and keyed by a digest of the API key,
+so rotating keys cannot grow it forever and no raw key is held as a dict key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Any
+
+from cachetools import LRUCache
+
+_clients: LRUCache = LRUCache(maxsize=16)
+_lock = threading.Lock()
+
+
+def get_openai_client(api_key: str) -> Any:
+    """Return the shared OpenAI client for api_key, creating it on first use."""
+    try:
+        from openai import OpenAI
+    except ImportError as e:
+        msg = "openai is not installed. Install with: pip install openai"
+        raise ImportError(msg) from e
+
+    key = hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = OpenAI(api_key=api_key)
+    return client
@@ -13,6 +13,11 @@ from langbuilder.schema import Data
 from loguru import logger
 import re
 
+# Patterns compiled once at import instead of going through the re cache on every parse
+CONTACT_ID_PATTERN = re.compile(r"\b(\d{7,})\b")
+TOPIC_PATTERN = re.compile(r"\babout\s+(.+)$", re.IGNORECASE)
+ABOUT_CLAUSE_PATTERN = re.compile(r"\s*about\s+.+$", re.IGNORECASE)
+
 
 class ContactInfoExtractorComponent(Component):
     """
@@ -55,6 +60,7 @@ class ContactInfoExtractorComponent(Component):
         "can",
         "you",
     ]
+    FILLER_PATTERN = re.compile(r"\b(" + "|".join(FILLER_WORDS) + r")\b", re.IGNORECASE)
 
     inputs = [
         MessageTextInput(
@@ -97,13 +103,13 @@ class ContactInfoExtractorComponent(Component):
             return Data(data=result)
 
         # 1. Look for contact ID (7+ digit number)
-        contact_id_match = re.search(r"\b(\d{7,})\b", text)
+        contact_id_match = CONTACT_ID_PATTERN.search(text)
         if contact_id_match:
             result["contact_id"] = contact_id_match.group(1)
             logger.info(f"Found contact ID: {result['contact_id']}")
 
         # 2. Extract topic - look for "about X" pattern
-        topic_match = re.search(r"\babout\s+(.+)$", text, re.IGNORECASE)
+        topic_match = TOPIC_PATTERN.search(text)
         if topic_match:
             result["topic"] = topic_match.group(1).strip()
             logger.info(f"Found topic: {result['topic']}")
@@ -111,11 +117,10 @@ class ContactInfoExtractorComponent(Component):
         # 3. If no contact ID, extract the name
         if not result["contact_id"] and result["topic"]:
             # Get everything before "about"
-            name_part = re.sub(r"\s*about\s+.+$", "", text, flags=re.IGNORECASE)
+            name_part = ABOUT_CLAUSE_PATTERN.sub("", text)
 
             # Remove all filler/command words
-            filler_pattern = r"\b(" + "|".join(self.FILLER_WORDS) + r")\b"
-            name_part = re.sub(filler_pattern, "", name_part, flags=re.IGNORECASE)
+            name_part = self.FILLER_PATTERN.sub("", name_part)
 
             # Clean up extra whitespace
             name_part = " ".join(name_part.split()).strip()
@@ -136,7 +141,7 @@ class ContactInfoExtractorComponent(Component):
             remaining = remaining.strip()
 
             # Also check for "about X" pattern in remaining
-            topic_match = re.search(r"\babout\s+(.+)$", remaining, re.IGNORECASE)
+            topic_match = TOPIC_PATTERN.search(remaining)
             if topic_match:
                 result["topic"] = topic_match.group(1).strip()
             elif remaining:
@@ -19,6 +19,7 @@ from pydantic import BaseModel, Field, create_model
 
 from langbuilder.base.langchain_utilities.model import LCToolComponent
 from langbuilder.base.tools.constants import TOOL_OUTPUT_NAME, TOOL_OUTPUT_DISPLAY_NAME
+from langbuilder.components.cloudgeometry._openai_clients import get_openai_client
 from langbuilder.field_typing import Tool
 from langbuilder.io import (
     BoolInput,
@@ -241,12 +242,6 @@ class PineconeSearchToolComponent(LCToolComponent):
             return result[0]['values']
 
         # 3. Fall back to OpenAI
-        try:
-            from openai import OpenAI
-        except ImportError as e:
-            msg = "openai is not installed. Install with: pip install openai"
-            raise ImportError(msg) from e
-
         openai_key = self.openai_api_key
         if hasattr(openai_key, "get_secret_value"):
             openai_key = openai_key.get_secret_value()
@@ -256,7 +251,7 @@ class PineconeSearchToolComponent(LCToolComponent):
             msg = "No embedding method available. Connect an Embedding model, enable Pinecone inference, or set OPENAI_API_KEY."
             raise ValueError(msg)
 
-        client = OpenAI(api_key=openai_key)
+        client = get_openai_client(openai_key)
         # Use dimensions parameter for text-embedding-3 models to match index dimensions
         # Default 1024 matches Pinecone inference models (multilingual-e5-large, llama-text-embed-v2)
         dimensions = getattr(self, "openai_dimensions", None) or 1024
@@ -1,8 +1,12 @@
+import copy
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from cachetools import TTLCache
 from composio import Action
 
-from langbuilder.base.composio.composio_base import ComposioBaseComponent
+from langbuilder.base.composio.composio_base import ComposioBaseComponent, LazyInputs
 from langbuilder.inputs import (
     BoolInput,
     IntInput,
@@ -12,6 +16,38 @@ from langbuilder.inputs import (
 from langbuilder.logging import logger
 
 
+def _advanced_text_input(name: str, display_name: str, info: str) -> MessageTextInput:
+    """Build an optional, initially hidden text field for an action."""
+    return MessageTextInput(name=name, display_name=display_name, info=info, show=False, advanced=True)
+
+
+def _normalize_action(action: Any) -> str | None:
+    """Return the display name of the selected action, or None when no action is selected."""
+    if isinstance(action, list):
+        return action[0]["name"] if action else None
+    return None if action in (None, "", "disabled") else action
+
+
+def _build_action_specs(actions_data: dict, bool_variables: set[str]) -> dict[str, list[tuple[str, str, bool, bool]]]:
+    """Precompute (field, param name, is bool, is labels) for every action's fields."""
+    return {
+        action_key: [
+            (field, field.removeprefix(f"{action_key}_"), field in bool_variables, field.endswith("_labels"))
+            for field in action_data["action_fields"]
+        ]
+        for action_key, action_data in actions_data.items()
+    }
+
+
+def _declared_paged_actions(actions_data: dict, candidates: dict[str, tuple[str, str]]) -> dict[str, tuple[str, str]]:
+    """Keep the paging candidates whose action schema actually declares the offset field."""
+    return {
+        action_key: page_params
+        for action_key, page_params in candidates.items()
+        if f"{action_key}_{page_params[1]}" in actions_data[action_key]["action_fields"]
+    }
+
+
 class ComposioJiraAPIComponent(ComposioBaseComponent):
     """Jira API component for interacting with Jira services via Composio."""
 
@@ -46,6 +82,13 @@ class ComposioJiraAPIComponent(ComposioBaseComponent):
                 "JIRA_GET_ISSUE_expand",
             ],
         },
+        "JIRA_BATCH_GET_ISSUES": {
+            "display_name": "Batch Get Issues",
+            "action_fields": [
+                "JIRA_BATCH_GET_ISSUES_issue_keys",
+                "JIRA_BATCH_GET_ISSUES_fields",
+            ],
+        },
         "JIRA_EDIT_ISSUE": {
             "display_name": "Edit Issue",
             "action_fields": [
@@ -145,429 +188,398 @@ class ComposioJiraAPIComponent(ComposioBaseComponent):
         },
     }
 
+    # Actions without a Composio counterpart, served by rewriting the request onto JIRA_SEARCH_ISSUES
+    _virtual_actions = {"JIRA_BATCH_GET_ISSUES"}
+
+    # Paginated actions mapped to their (page size, offset) parameter names. Only actions whose schema
+    # declares the offset field are paged; an undeclared offset may be dropped and return the first page again.
+    _paged_actions = _declared_paged_actions(
+        _actions_data,
+        {
+            "JIRA_GET_ALL_PROJECTS": ("maxResults", "startAt"),
+            "JIRA_LIST_SPRINTS": ("max_results", "start_at"),
+            "JIRA_FIND_USERS": ("max_results", "start_at"),
+        },
+    )
+    _page_size = 100
+    _max_concurrent_pages = 5
+
+    # Rarely changing metadata reads, served from a shared TTL cache
+    _cached_actions = {"JIRA_GET_ALL_PROJECTS", "JIRA_FIND_USERS"}
+    _metadata_cache: TTLCache = TTLCache(maxsize=512, ttl=600)
+
     _all_fields = {field for action_data in _actions_data.values() for field in action_data["action_fields"]}
     _bool_variables = {
         "JIRA_DELETE_ISSUE_delete_subtasks",
         "JIRA_EDIT_ISSUE_notify_users",
     }
 
-    inputs = [
-        *ComposioBaseComponent._base_inputs,
-        # Atlassian subdomain configuration
-        MessageTextInput(
-            name="atlassian_subdomain",
-            display_name="Atlassian Subdomain",
-            info="Your Atlassian subdomain (e.g., 'cloudgeometry' for cloudgeometry.atlassian.net)",
-            value="cloudgeometry",
-            advanced=True,
-        ),
-        # Create Issue fields
-        MessageTextInput(
-            name="JIRA_CREATE_ISSUE_project_key",
-            display_name="Project Key",
-            info="The project key (e.g., 'PROJ', 'DEV')",
-            show=False,
-            required=True,
-        ),
-        MessageTextInput(
-            name="JIRA_CREATE_ISSUE_summary",
-            display_name="Summary",
-            info="Brief summary of the issue",
-            show=False,
-            required=True,
-        ),
-        MultilineInput(
-            name="JIRA_CREATE_ISSUE_description",
-            display_name="Description",
-            info="Detailed description of the issue",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_CREATE_ISSUE_issue_type",
-            display_name="Issue Type",
-            info="Type of issue (e.g., 'Bug', 'Task', 'Story', 'Epic')",
-            show=False,
-            value="Task",
-        ),
-        MessageTextInput(
-            name="JIRA_CREATE_ISSUE_priority",
-            display_name="Priority",
-            info="Priority level (e.g., 'Highest', 'High', 'Medium', 'Low', 'Lowest')",
-            show=False,
-            advanced=True,
-        ),
-        MessageTextInput(
-            name="JIRA_CREATE_ISSUE_assignee",
-            display_name="Assignee",
-            info="Account ID of the user to assign the issue to",
-            show=False,
-            advanced=True,
-        ),
-        MessageTextInput(
-            name="JIRA_CREATE_ISSUE_labels",
-            display_name="Labels",
-            info="Comma-separated list of labels",
-            show=False,
-            advanced=True,
-        ),
-        MessageTextInput(
-            name="JIRA_CREATE_ISSUE_due_date",
-            display_name="Due Date",
-            info="Due date in YYYY-MM-DD format",
-            show=False,
-            advanced=True,
-        ),
-        # Get Issue fields
-        MessageTextInput(
-            name="JIRA_GET_ISSUE_issue_key",
-            display_name="Issue Key",
-            info="The issue key (e.g., 'PROJ-123')",
-            show=False,
-            required=True,
-        ),
-        MessageTextInput(
-            name="JIRA_GET_ISSUE_fields",
-            display_name="Fields",
-            info="Comma-separated list of fields to return",
-            show=False,
-            advanced=True,
-        ),
-        MessageTextInput(
-            name="JIRA_GET_ISSUE_expand",
-            display_name="Expand",
-            info="Comma-separated list of fields to expand",
-            show=False,
-            advanced=True,
-        ),
-        # Edit Issue fields
-        MessageTextInput(
-            name="JIRA_EDIT_ISSUE_issue_id_or_key",
-            display_name="Issue ID or Key",
-            info="The issue ID or key to edit",
-            show=False,
-            required=True,
-        ),
-        MessageTextInput(
-            name="JIRA_EDIT_ISSUE_summary",
-            display_name="Summary",
-            info="New summary for the issue",
-            show=False,
-        ),
-        MultilineInput(
-            name="JIRA_EDIT_ISSUE_description",
-            display_name="Description",
-            info="New description for the issue",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_EDIT_ISSUE_priority_id_or_name",
-            display_name="Priority",
-            info="New priority level",
-            show=False,
-            advanced=True,
-        ),
-        MessageTextInput(
-            name="JIRA_EDIT_ISSUE_assignee",
-            display_name="Assignee",
-            info="New assignee account ID",
-            show=False,
-            advanced=True,
-        ),
-        MessageTextInput(
-            name="JIRA_EDIT_ISSUE_labels",
-            display_name="Labels",
-            info="Comma-separated list of new labels",
-            show=False,
-            advanced=True,
-        ),
-        MessageTextInput(
-            name="JIRA_EDIT_ISSUE_due_date",
-            display_name="Due Date",
-            info="New due date in YYYY-MM-DD format",
-            show=False,
-            advanced=True,
-        ),
-        BoolInput(
-            name="JIRA_EDIT_ISSUE_notify_users",
-            display_name="Notify Users",
-            info="Whether to notify users of the change",
-            show=False,
-            value=True,
-            advanced=True,
-        ),
-        # Delete Issue fields
-        MessageTextInput(
-            name="JIRA_DELETE_ISSUE_issue_id_or_key",
-            display_name="Issue ID or Key",
-            info="The issue ID or key to delete",
-            show=False,
-            required=True,
-        ),
-        BoolInput(
-            name="JIRA_DELETE_ISSUE_delete_subtasks",
-            display_name="Delete Subtasks",
-            info="Whether to delete subtasks as well",
-            show=False,
-            value=False,
-        ),
-        # Search Issues fields
-        MessageTextInput(
-            name="JIRA_SEARCH_ISSUES_jql",
-            display_name="JQL Query",
-            info="JQL query string for advanced search",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_SEARCH_ISSUES_project_key",
-            display_name="Project Key",
-            info="Filter by project key",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_SEARCH_ISSUES_assignee",
-            display_name="Assignee",
-            info="Filter by assignee account ID",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_SEARCH_ISSUES_status_id_or_name",
-            display_name="Status",
-            info="Filter by status (e.g., 'To Do', 'In Progress', 'Done')",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_SEARCH_ISSUES_issue_type_id_or_name",
-            display_name="Issue Type",
-            info="Filter by issue type",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_SEARCH_ISSUES_labels",
-            display_name="Labels",
-            info="Filter by labels (comma-separated)",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_SEARCH_ISSUES_text_search",
-            display_name="Text Search",
-            info="Full-text search query",
-            show=False,
-        ),
-        IntInput(
-            name="JIRA_SEARCH_ISSUES_max_results",
-            display_name="Max Results",
-            info="Maximum number of results to return",
-            show=False,
-            value=50,
-            advanced=True,
-        ),
-        MessageTextInput(
-            name="JIRA_SEARCH_ISSUES_fields",
-            display_name="Fields",
-            info="Comma-separated list of fields to return",
-            show=False,
-            advanced=True,
-        ),
-        # Add Comment fields
-        MessageTextInput(
-            name="JIRA_ADD_COMMENT_issue_id_or_key",
-            display_name="Issue ID or Key",
-            info="The issue ID or key to comment on",
-            show=False,
-            required=True,
-        ),
-        MultilineInput(
-            name="JIRA_ADD_COMMENT_comment",
-            display_name="Comment",
-            info="The comment text",
-            show=False,
-            required=True,
-        ),
-        MessageTextInput(
-            name="JIRA_ADD_COMMENT_visibility_type",
-            display_name="Visibility Type",
-            info="Visibility type ('group' or 'role')",
-            show=False,
-            advanced=True,
-        ),
-        MessageTextInput(
-            name="JIRA_ADD_COMMENT_visibility_value",
-            display_name="Visibility Value",
-            info="The group name or role name for visibility",
-            show=False,
-            advanced=True,
-        ),
-        # Transition Issue fields
-        MessageTextInput(
-            name="JIRA_TRANSITION_ISSUE_issue_id_or_key",
-            display_name="Issue ID or Key",
-            info="The issue ID or key to transition",
-            show=False,
-            required=True,
-        ),
-        MessageTextInput(
-            name="JIRA_TRANSITION_ISSUE_transition_id_or_name",
-            display_name="Transition",
-            info="The transition ID or name (e.g., 'In Progress', 'Done')",
-            show=False,
-            required=True,
-        ),
-        MessageTextInput(
-            name="JIRA_TRANSITION_ISSUE_comment",
-            display_name="Comment",
-            info="Optional comment for the transition",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_TRANSITION_ISSUE_resolution",
-            display_name="Resolution",
-            info="Resolution for the issue (if closing)",
-            show=False,
-            advanced=True,
-        ),
-        MessageTextInput(
-            name="JIRA_TRANSITION_ISSUE_assignee",
-            display_name="Assignee",
-            info="New assignee during transition",
-            show=False,
-            advanced=True,
-        ),
-        # Assign Issue fields
-        MessageTextInput(
-            name="JIRA_ASSIGN_ISSUE_issue_id_or_key",
-            display_name="Issue ID or Key",
-            info="The issue ID or key to assign",
-            show=False,
-            required=True,
-        ),
-        MessageTextInput(
-            name="JIRA_ASSIGN_ISSUE_account_id",
-            display_name="Account ID",
-            info="The account ID of the user to assign",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_ASSIGN_ISSUE_assignee_name",
-            display_name="Assignee Name",
-            info="The display name of the user to assign (alternative to account ID)",
-            show=False,
-        ),
-        # Get All Projects fields
-        IntInput(
-            name="JIRA_GET_ALL_PROJECTS_maxResults",
-            display_name="Max Results",
-            info="Maximum number of projects to return",
-            show=False,
-            value=50,
-        ),
-        IntInput(
-            name="JIRA_GET_ALL_PROJECTS_startAt",
-            display_name="Start At",
-            info="Index to start at for pagination",
-            show=False,
-            value=0,
-            advanced=True,
-        ),
-        MessageTextInput(
-            name="JIRA_GET_ALL_PROJECTS_expand",
-            display_name="Expand",
-            info="Comma-separated list of fields to expand",
-            show=False,
-            advanced=True,
-        ),
-        # List Sprints fields
-        IntInput(
-            name="JIRA_LIST_SPRINTS_board_id",
-            display_name="Board ID",
-            info="The ID of the board to get sprints from",
-            show=False,
-            required=True,
-        ),
-        MessageTextInput(
-            name="JIRA_LIST_SPRINTS_state",
-            display_name="State",
-            info="Filter by sprint state ('active', 'closed', 'future')",
-            show=False,
-        ),
-        IntInput(
-            name="JIRA_LIST_SPRINTS_max_results",
-            display_name="Max Results",
-            info="Maximum number of sprints to return",
-            show=False,
-            value=50,
-            advanced=True,
-        ),
-        IntInput(
-            name="JIRA_LIST_SPRINTS_start_at",
-            display_name="Start At",
-            info="Index to start at for pagination",
-            show=False,
-            value=0,
-            advanced=True,
-        ),
-        # Create Sprint fields
-        MessageTextInput(
-            name="JIRA_CREATE_SPRINT_name",
-            display_name="Name",
-            info="Name of the sprint",
-            show=False,
-            required=True,
-        ),
-        IntInput(
-            name="JIRA_CREATE_SPRINT_origin_board_id",
-            display_name="Board ID",
-            info="The ID of the board to create the sprint on",
-            show=False,
-            required=True,
-        ),
-        MessageTextInput(
-            name="JIRA_CREATE_SPRINT_goal",
-            display_name="Goal",
-            info="The goal of the sprint",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_CREATE_SPRINT_start_date",
-            display_name="Start Date",
-            info="Start date in ISO 8601 format",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_CREATE_SPRINT_end_date",
-            display_name="End Date",
-            info="End date in ISO 8601 format",
-            show=False,
-        ),
-        # Find Users fields
-        MessageTextInput(
-            name="JIRA_FIND_USERS_query",
-            display_name="Query",
-            info="Search query (email or display name)",
-            show=False,
-        ),
-        MessageTextInput(
-            name="JIRA_FIND_USERS_account_id",
-            display_name="Account ID",
-            info="Filter by specific account ID",
-            show=False,
-        ),
-        IntInput(
-            name="JIRA_FIND_USERS_max_results",
-            display_name="Max Results",
-            info="Maximum number of users to return",
-            show=False,
-            value=50,
-            advanced=True,
-        ),
-        IntInput(
-            name="JIRA_FIND_USERS_start_at",
-            display_name="Start At",
-            info="Index to start at for pagination",
-            show=False,
-            value=0,
-            advanced=True,
-        ),
-    ]
+    # Sanitized display names of the Create Issue and Search Issues actions
+    _DEFAULT_TOOLS = frozenset({"Create-Issue", "Search-Issues"})
+
+    _action_specs = _build_action_specs(_actions_data, _bool_variables)
+
+    inputs = LazyInputs()
+
+    @classmethod
+    def _build_inputs(cls) -> list:
+        return [
+            *ComposioBaseComponent._base_inputs,
+            # Atlassian subdomain configuration
+            MessageTextInput(
+                name="atlassian_subdomain",
+                display_name="Atlassian Subdomain",
+                info="Your Atlassian subdomain (e.g., 'cloudgeometry' for cloudgeometry.atlassian.net)",
+                value="cloudgeometry",
+                advanced=True,
+            ),
+            BoolInput(
+                name="clear_cache",
+                display_name="Clear Cache",
+                info="Discard cached project and user lookups before running the action",
+                value=False,
+                advanced=True,
+            ),
+            # Create Issue fields
+            MessageTextInput(
+                name="JIRA_CREATE_ISSUE_project_key",
+                display_name="Project Key",
+                info="The project key (e.g., 'PROJ', 'DEV')",
+                show=False,
+                required=True,
+            ),
+            MessageTextInput(
+                name="JIRA_CREATE_ISSUE_summary",
+                display_name="Summary",
+                info="Brief summary of the issue",
+                show=False,
+                required=True,
+            ),
+            MultilineInput(
+                name="JIRA_CREATE_ISSUE_description",
+                display_name="Description",
+                info="Detailed description of the issue",
+                show=False,
+            ),
+            MessageTextInput(
+                name="JIRA_CREATE_ISSUE_issue_type",
+                display_name="Issue Type",
+                info="Type of issue (e.g., 'Bug', 'Task', 'Story', 'Epic')",
+                show=False,
+                value="Task",
+            ),
+            _advanced_text_input(
+                "JIRA_CREATE_ISSUE_priority",
+                "Priority",
+                "Priority level (e.g., 'Highest', 'High', 'Medium', 'Low', 'Lowest')",
+            ),
+            _advanced_text_input(
+                "JIRA_CREATE_ISSUE_assignee",
+                "Assignee",
+                "Account ID of the user to assign the issue to",
+            ),
+            _advanced_text_input("JIRA_CREATE_ISSUE_labels", "Labels", "Comma-separated list of labels"),
+            _advanced_text_input("JIRA_CREATE_ISSUE_due_date", "Due Date", "Due date in YYYY-MM-DD format"),
+            # Get Issue fields
+            MessageTextInput(
+                name="JIRA_GET_ISSUE_issue_key",
+                display_name="Issue Key",
+                info="The issue key (e.g., 'PROJ-123')",
+                show=False,
+                required=True,
+            ),
+            _advanced_text_input("JIRA_GET_ISSUE_fields", "Fields", "Comma-separated list of fields to return"),
+            _advanced_text_input("JIRA_GET_ISSUE_expand", "Expand", "Comma-separated list of fields to expand"),
+            # Batch Get Issues fields
+            MessageTextInput(
+                name="JIRA_BATCH_GET_ISSUES_issue_keys",
+                display_name="Issue Keys",
+                info="Comma-separated list of issue keys (e.g., 'PROJ-1, PROJ-2'), fetched in a single search",
+                show=False,
+                required=True,
+            ),
+            _advanced_text_input("JIRA_BATCH_GET_ISSUES_fields", "Fields", "Comma-separated list of fields to return"),
+            # Edit Issue fields
+            MessageTextInput(
+                name="JIRA_EDIT_ISSUE_issue_id_or_key",
+                display_name="Issue ID or Key",
+                info="The issue ID or key to edit",
+                show=False,
+                required=True,
+            ),
+            MessageTextInput(
+                name="JIRA_EDIT_ISSUE_summary",
+                display_name="Summary",
+                info="New summary for the issue",
+                show=False,
+            ),
+            MultilineInput(
+                name="JIRA_EDIT_ISSUE_description",
+                display_name="Description",
+                info="New description for the issue",
+                show=False,
+            ),
+            _advanced_text_input("JIRA_EDIT_ISSUE_priority_id_or_name", "Priority", "New priority level"),
+            _advanced_text_input("JIRA_EDIT_ISSUE_assignee", "Assignee", "New assignee account ID"),
+            _advanced_text_input("JIRA_EDIT_ISSUE_labels", "Labels", "Comma-separated list of new labels"),
+            _advanced_text_input("JIRA_EDIT_ISSUE_due_date", "Due Date", "New due date in YYYY-MM-DD format"),
+            BoolInput(
+                name="JIRA_EDIT_ISSUE_notify_users",
+                display_name="Notify Users",
+                info="Whether to notify users of the change",
+                show=False,
+                value=True,
+                advanced=True,
+            ),
+            # Delete Issue fields
+            MessageTextInput(
+                name="JIRA_DELETE_ISSUE_issue_id_or_key",
+                display_name="Issue ID or Key",
+                info="The issue ID or key to delete",
+                show=False,
+                required=True,
+            ),
+            BoolInput(
+                name="JIRA_DELETE_ISSUE_delete_subtasks",
+                display_name="Delete Subtasks",
+                info="Whether to delete subtasks as well",
+                show=False,
+                value=False,
+            ),
+            # Search Issues fields
+            MessageTextInput(
+                name="JIRA_SEARCH_ISSUES_jql",
+                display_name="JQL Query",
+                info="JQL query string for advanced search",
+                show=False,
+            ),
+            MessageTextInput(
+                name="JIRA_SEARCH_ISSUES_project_key",
+                display_name="Project Key",
+                info="Filter by project key",
+                show=False,
+            ),
+            MessageTextInput(
+                name="JIRA_SEARCH_ISSUES_assignee",
+                display_name="Assignee",
+                info="Filter by assignee account ID",
+                show=False,
+            ),
+            MessageTextInput(
+                name="JIRA_SEARCH_ISSUES_status_id_or_name",
+                display_name="Status",
+                info="Filter by status (e.g., 'To Do', 'In Progress', 'Done')",
+                show=False,
+            ),
+            MessageTextInput(
+                name="JIRA_SEARCH_ISSUES_issue_type_id_or_name",
+                display_name="Issue Type",
+                info="Filter by issue type",
+                show=False,
+            ),
+            MessageTextInput(
+                name="JIRA_SEARCH_ISSUES_labels",
+                display_name="Labels",
+                info="Filter by labels (comma-separated)",
+                show=False,
+            ),
+            MessageTextInput(
+                name="JIRA_SEARCH_ISSUES_text_search",
+                display_name="Text Search",
+                info="Full-text search query",
+                show=False,
+            ),
+            IntInput(
+                name="JIRA_SEARCH_ISSUES_max_results",
+                display_name="Max Results",
+                info="Maximum number of results to return",
+                show=False,
+                value=50,
+                advanced=True,
+            ),
+            _advanced_text_input("JIRA_SEARCH_ISSUES_fields", "Fields", "Comma-separated list of fields to return"),
+            # Add Comment fields
+            MessageTextInput(
+                name="JIRA_ADD_COMMENT_issue_id_or_key",
+                display_name="Issue ID or Key",
+                info="The issue ID or key to comment on",
+                show=False,
+                required=True,
+            ),
+            MultilineInput(
+                name="JIRA_ADD_COMMENT_comment",
+                display_name="Comment",
+                info="The comment text",
+                show=False,
+                required=True,
+            ),
+            _advanced_text_input(
+                "JIRA_ADD_COMMENT_visibility_type",
+                "Visibility Type",
+                "Visibility type ('group' or 'role')",
+            ),
+            _advanced_text_input(
+                "JIRA_ADD_COMMENT_visibility_value",
+                "Visibility Value",
+                "The group name or role name for visibility",
+            ),
+            # Transition Issue fields
+            MessageTextInput(
+                name="JIRA_TRANSITION_ISSUE_issue_id_or_key",
+                display_name="Issue ID or Key",
+                info="The issue ID or key to transition",
+                show=False,
+                required=True,
+            ),
+            MessageTextInput(
+                name="JIRA_TRANSITION_ISSUE_transition_id_or_name",
+                display_name="Transition",
+                info="The transition ID or name (e.g., 'In Progress', 'Done')",
+                show=False,
+                required=True,
+            ),
+            MessageTextInput(
+                name="JIRA_TRANSITION_ISSUE_comment",
+                display_name="Comment",
+                info="Optional comment for the transition",
+                show=False,
+            ),
+            _advanced_text_input(
+                "JIRA_TRANSITION_ISSUE_resolution",
+                "Resolution",
+                "Resolution for the issue (if closing)",
+            ),
+            _advanced_text_input("JIRA_TRANSITION_ISSUE_assignee", "Assignee", "New assignee during transition"),
+            # Assign Issue fields
+            MessageTextInput(
+                name="JIRA_ASSIGN_ISSUE_issue_id_or_key",
+                display_name="Issue ID or Key",
+                info="The issue ID or key to assign",
+                show=False,
+                required=True,
+            ),
+            MessageTextInput(
+                name="JIRA_ASSIGN_ISSUE_account_id",
+                display_name="Account ID",
+                info="The account ID of the user to assign",
+                show=False,
+            ),
+            MessageTextInput(
+                name="JIRA_ASSIGN_ISSUE_assignee_name",
+                display_name="Assignee Name",
+                info="The display name of the user to assign (alternative to account ID)",
+                show=False,
+            ),
+            # Get All Projects fields
+            IntInput(
+                name="JIRA_GET_ALL_PROJECTS_maxResults",
+                display_name="Max Results",
+                info="Maximum number of projects to return",
+                show=False,
+                value=50,
+            ),
+            IntInput(
+                name="JIRA_GET_ALL_PROJECTS_startAt",
+                display_name="Start At",
+                info="Index to start at for pagination",
+                show=False,
+                value=0,
+                advanced=True,
+            ),
+            _advanced_text_input("JIRA_GET_ALL_PROJECTS_expand", "Expand", "Comma-separated list of fields to expand"),
+            # List Sprints fields
+            IntInput(
+                name="JIRA_LIST_SPRINTS_board_id",
+                display_name="Board ID",
+                info="The ID of the board to get sprints from",
+                show=False,
+                required=True,
+            ),
+            MessageTextInput(
+                name="JIRA_LIST_SPRINTS_state",
+                display_name="State",
+                info="Filter by sprint state ('active', 'closed', 'future')",
+                show=False,
+            ),
+            IntInput(
+                name="JIRA_LIST_SPRINTS_max_results",
+                display_name="Max Results",
+                info="Maximum number of sprints to return",
+                show=False,
+                value=50,
+                advanced=True,
+            ),
+            IntInput(
+                name="JIRA_LIST_SPRINTS_start_at",
+                display_name="Start At",
+                info="Index to start at for pagination",
+                show=False,
+                value=0,
+                advanced=True,
+            ),
+            # Create Sprint fields
+            MessageTextInput(
+                name="JIRA_CREATE_SPRINT_name",
+                display_name="Name",
+                info="Name of the sprint",
+                show=False,
+                required=True,
+            ),
+            IntInput(
+                name="JIRA_CREATE_SPRINT_origin_board_id",
+                display_name="Board ID",
+                info="The ID of the board to create the sprint on",
+                show=False,
+                required=True,
+            ),
+            MessageTextInput(
+                name="JIRA_CREATE_SPRINT_goal",
+                display_name="Goal",
+                info="The goal of the sprint",
+                show=False,
+            ),
+            MessageTextInput(
+                name="JIRA_CREATE_SPRINT_start_date",
+                display_name="Start Date",
+                info="Start date in ISO 8601 format",
+                show=False,
+            ),
+            MessageTextInput(
+                name="JIRA_CREATE_SPRINT_end_date",
+                display_name="End Date",
+                info="End date in ISO 8601 format",
+                show=False,
+            ),
+            # Find Users fields
+            MessageTextInput(
+                name="JIRA_FIND_USERS_query",
+                display_name="Query",
+                info="Search query (email or display name)",
+                show=False,
+            ),
+            MessageTextInput(
+                name="JIRA_FIND_USERS_account_id",
+                display_name="Account ID",
+                info="Filter by specific account ID",
+                show=False,
+            ),
+            IntInput(
+                name="JIRA_FIND_USERS_max_results",
+                display_name="Max Results",
+                info="Maximum number of users to return",
+                show=False,
+                value=50,
+                advanced=True,
+            ),
+            IntInput(
+                name="JIRA_FIND_USERS_start_at",
+                display_name="Start At",
+                info="Index to start at for pagination",
+                show=False,
+                value=0,
+                advanced=True,
+            ),
+        ]
 
     def _initiate_default_connection(self, entity, app: str) -> str:
         """Override to pass Atlassian subdomain for OAuth connection."""
@@ -583,7 +595,8 @@ class ComposioJiraAPIComponent(ComposioBaseComponent):
     def execute_action(self):
         """Execute action and return response."""
         # Validate action is selected
-        if not self.action or self.action == "disabled" or (isinstance(self.action, list) and not self.action):
+        display_name = _normalize_action(self.action)
+        if display_name is None:
             msg = "Please select an action before executing. Connect your Composio account and choose an action from the dropdown."
             raise ValueError(msg)
 
@@ -591,57 +604,120 @@ class ComposioJiraAPIComponent(ComposioBaseComponent):
 
         try:
             self._build_action_maps()
-            # Get the display name from the action list
-            display_name = self.action[0]["name"] if isinstance(self.action, list) and self.action else self.action
             # Use the display_to_key_map to get the action key
             action_key = self._display_to_key_map.get(display_name)
             if not action_key:
                 msg = f"Invalid action: {display_name}. Please select a valid action from the dropdown."
                 raise ValueError(msg)
 
-            enum_name = getattr(Action, action_key)
-            params = {}
-            if action_key in self._actions_data:
-                for field in self._actions_data[action_key]["action_fields"]:
-                    value = getattr(self, field, None)
+            params = {
+                param_name: bool(value)
+                if is_bool
+                else (list(filter(None, map(str.strip, value.split(",")))) if is_labels else value)
+                for field, param_name, is_bool, is_labels in self._action_specs.get(action_key, ())
+                if (value := getattr(self, field, None)) not in (None, "")
+            }
 
-                    if value is None or value == "":
-                        continue
+            if action_key == "JIRA_BATCH_GET_ISSUES":
+                action_key = "JIRA_SEARCH_ISSUES"
+                params = self._build_batch_get_params(params)
 
-                    # Handle comma-separated lists for labels
-                    if field.endswith("_labels") and value:
-                        value = [item.strip() for item in value.split(",")]
-
-                    if field in self._bool_variables:
-                        value = bool(value)
-
-                    param_name = field.replace(action_key + "_", "")
-                    params[param_name] = value
-
-            result = toolset.execute_action(
-                action=enum_name,
-                params=params,
-            )
+            if self.clear_cache:
+                self._metadata_cache.clear()
+            cache_key = self._get_cache_key(action_key, params) if action_key in self._cached_actions else None
+            cached = self._metadata_cache.get(cache_key) if cache_key else None
+            # Entries are copied in and out so a caller mutating its result cannot alter the cache
+            result = copy.deepcopy(cached) if cached is not None else None
+            if result is None:
+                enum_name = getattr(Action, action_key)
+                page_param = self._paged_actions.get(action_key, (None,))[0]
+                if page_param and params.get(page_param, 0) > self._page_size:
+                    result = self._execute_paged(toolset, enum_name, action_key, params)
+                else:
+                    result = self._run_action(toolset, enum_name, params)
+                if cache_key and result.get("successful"):
+                    self._metadata_cache[cache_key] = copy.deepcopy(result)
             if not result.get("successful"):
                 error_message = result.get("error", "Unknown error")
                 return {"error": str(error_message), "successful": False}
 
             result_data = result.get("data", {})
-            if isinstance(result_data.get("details"), list):
-                return result_data.get("details")
-            return result_data
+            details = result_data.get("details")
+            return details if isinstance(details, list) else result_data
 
         except Exception as e:
-            logger.error(f"Error executing Jira action: {e}")
-            display_name = self.action[0]["name"] if isinstance(self.action, list) and self.action else str(self.action)
+            logger.error("Error executing Jira action: {}", e)
             msg = f"Failed to execute {display_name}: {e!s}"
             raise ValueError(msg) from e
 
+    def _get_cache_key(self, action_key: str, params: dict) -> tuple:
+        # Scope entries to the account so cached metadata is never shared across Composio credentials,
+        # without keeping the raw API key in the cache
+        return (
+            hashlib.blake2b(str(self.api_key).encode(), digest_size=8).digest(),
+            self.entity_id,
+            action_key,
+            tuple(sorted((key, str(value)) for key, value in params.items())),
+        )
+
+    def _run_action(self, toolset, enum_name, params: dict) -> dict:
+        return toolset.execute_action(action=enum_name, params=params)
+
+    def _execute_paged(self, toolset, enum_name, action_key: str, params: dict) -> dict:
+        """Fetch a large result set by probing the total and then requesting every page concurrently."""
+        limit_param, offset_param = self._paged_actions[action_key]
+        start = params.get(offset_param, 0)
+        probe = self._run_action(toolset, enum_name, {**params, limit_param: 1})
+        if not probe.get("successful"):
+            return probe
+
+        probe_data = probe.get("data", {})
+        envelope = self._page_envelope(probe)
+        total = envelope.get("total")
+        items_key = next((key for key in ("issues", "values") if isinstance(envelope.get(key), list)), None)
+        if not isinstance(total, int) or items_key is None:
+            # Not a paginated payload (e.g. user search returns a bare list); fall back to a single request
+            return self._run_action(toolset, enum_name, params)
+
+        end = min(start + params[limit_param], total)
+
+        def fetch_page(offset: int) -> dict:
+            page_params = {**params, offset_param: offset, limit_param: min(self._page_size, end - offset)}
+            return self._run_action(toolset, enum_name, page_params)
+
+        # Pages are independent, so fetch them on a small thread pool; map keeps them in offset order
+        with ThreadPoolExecutor(max_workers=self._max_concurrent_pages) as executor:
+            pages = list(executor.map(fetch_page, range(start, end, self._page_size)))
+        items = []
+        for page in pages:
+            if not page.get("successful"):
+                return page
+            items.extend(self._page_envelope(page).get(items_key, []))
+        if isinstance(probe_data.get("details"), dict):
+            return {"successful": True, "data": {**probe_data, "details": {**envelope, items_key: items}}}
+        return {"successful": True, "data": {**probe_data, items_key: items}}
+
+    @staticmethod
+    def _page_envelope(result: dict) -> dict:
+        """Return the paging envelope (total, issues/values) of a result, which Composio nests under details."""
+        data = result.get("data", {})
+        details = data.get("details")
+        return details if isinstance(details, dict) else data
+
+    def _build_batch_get_params(self, params: dict) -> dict:
+        """Collapse a list of issue keys into a single JQL search instead of one request per key."""
+        issue_keys = [key.strip() for key in params.get("issue_keys", "").split(",") if key.strip()]
+        if not issue_keys:
+            msg = "Please provide at least one issue key."
+            raise ValueError(msg)
+        quoted_keys = ", ".join(f'"{key}"' for key in issue_keys)
+        search_params = {"jql": f"key in ({quoted_keys})", "max_results": len(issue_keys)}
+        if "fields" in params:
+            search_params["fields"] = params["fields"]
+        return search_params
+
     def update_build_config(self, build_config: dict, field_value: Any, field_name: str | None = None) -> dict:
         return super().update_build_config(build_config, field_value, field_name)
 
     def set_default_tools(self):
-        self._default_tools = {
-            self.sanitize_action_name("JIRA_CREATE_ISSUE").replace(" ", "-"),
-            self.sanitize_action_name("JIRA_SEARCH_ISSUES").replace(" ", "-"),
-        }
+        self._default_tools = self._DEFAULT_TOOLS
@@ -5,10 +5,25 @@ JSON credentials file. It validates the credentials and returns them for use by
 Google Sheets components.
 """
 
+import copy
+import hashlib
+import threading
+
+import orjson
+from cachetools import TTLCache
+
 from langbuilder.custom.custom_component.component import Component
 from langbuilder.inputs.inputs import MessageTextInput
 from langbuilder.schema.data import Data
 
+_REQUIRED_SA_FIELDS = frozenset({"type", "project_id", "private_key_id", "private_key", "client_email"})
+
+# Validated auth payloads keyed by a digest of the credentials JSON and scopes.
+# Bounded and time-limited so private keys are not held for the life of the process;
+# payloads are deep-copied in and out so callers never share the nested credentials.
+_AUTH_CACHE: TTLCache = TTLCache(maxsize=32, ttl=3600)
+_AUTH_CACHE_LOCK = threading.Lock()
+
 
 class GoogleSheetsAuth(Component):
     """Authenticates with Google Sheets API using service account credentials.
@@ -49,18 +64,27 @@ class GoogleSheetsAuth(Component):
         Raises:
             ValueError: If the credentials JSON is invalid or missing required fields.
         """
-        try:
-            import json
+        cache_key = hashlib.blake2b(f"{self.credentials_json}|{self.scopes}".encode(), digest_size=16).hexdigest()
+        with _AUTH_CACHE_LOCK:
+            auth_data = _AUTH_CACHE.get(cache_key)
+        if auth_data is not None:
+            self.status = f"Authenticated as {auth_data['credentials'].get('client_email', 'unknown')}"
+            return Data(data=copy.deepcopy(auth_data), text=self.status)
 
+        try:
             # Parse the credentials JSON
-            creds_dict = json.loads(self.credentials_json)
+            creds_dict = orjson.loads(self.credentials_json)
+
+            # A service account key is a JSON object
+            if not isinstance(creds_dict, dict):
+                msg = "Invalid service account JSON. Expected a JSON object with the service account fields"
+                raise TypeError(msg)
 
             # Validate required fields in service account
-            required_fields = ["type", "project_id", "private_key_id", "private_key", "client_email"]
-            missing_fields = [field for field in required_fields if field not in creds_dict]
+            missing_fields = _REQUIRED_SA_FIELDS - creds_dict.keys()
 
             if missing_fields:
-                msg = f"Invalid service account JSON. Missing fields: {', '.join(missing_fields)}"
+                msg = f"Invalid service account JSON. Missing fields: {', '.join(sorted(missing_fields))}"
                 raise ValueError(msg)
 
             # Parse scopes
@@ -74,11 +98,13 @@ class GoogleSheetsAuth(Component):
                 "scopes": scopes,
                 "project_id": creds_dict.get("project_id"),
             }
+            with _AUTH_CACHE_LOCK:
+                _AUTH_CACHE[cache_key] = copy.deepcopy(auth_data)
 
             self.status = f"Authenticated as {creds_dict.get('client_email', 'unknown')}"
             return Data(data=auth_data, text=self.status)
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             error_msg = f"Failed to parse credentials JSON: {e}"
             self.status = error_msg
             return Data(data={"error": error_msg}, text=error_msg)
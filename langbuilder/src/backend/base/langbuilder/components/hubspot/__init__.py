@@ -1,17 +1,39 @@
-from .hubspot_note_creator import HubSpotNoteCreator
-from .hubspot_file_uploader import HubSpotFileUploader
-from .hubspot_contact_fetcher import HubSpotContactFetcher
-from .hubspot_company_fetcher import HubSpotCompanyFetcher
-from .hubspot_contact_updater import HubSpotContactUpdater
-from .hubspot_contact_search import HubSpotContactSearchComponent
-from .hubspot_context_gather import HubSpotContextGatherComponent
-from .hubspot_property_update import HubSpotPropertyUpdateComponent
-from .hubspot_contact_creator import HubSpotContactCreatorComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langbuilder.components._importing import import_mod
+
+if TYPE_CHECKING:
+    from .hubspot_company_fetcher import HubSpotCompanyFetcher
+    from .hubspot_contact_batch_fetcher import HubSpotContactBatchFetcher
+    from .hubspot_contact_creator import HubSpotContactCreatorComponent
+    from .hubspot_contact_fetcher import HubSpotContactFetcher
+    from .hubspot_contact_search import HubSpotContactSearchComponent
+    from .hubspot_contact_updater import HubSpotContactUpdater
+    from .hubspot_context_gather import HubSpotContextGatherComponent
+    from .hubspot_file_uploader import HubSpotFileUploader
+    from .hubspot_note_creator import HubSpotNoteCreator
+    from .hubspot_property_update import HubSpotPropertyUpdateComponent
+
+_dynamic_imports = {
+    "HubSpotNoteCreator": "hubspot_note_creator",
+    "HubSpotFileUploader": "hubspot_file_uploader",
+    "HubSpotContactFetcher": "hubspot_contact_fetcher",
+    "HubSpotContactBatchFetcher": "hubspot_contact_batch_fetcher",
+    "HubSpotCompanyFetcher": "hubspot_company_fetcher",
+    "HubSpotContactUpdater": "hubspot_contact_updater",
+    "HubSpotContactSearchComponent": "hubspot_contact_search",
+    "HubSpotContextGatherComponent": "hubspot_context_gather",
+    "HubSpotPropertyUpdateComponent": "hubspot_property_update",
+    "HubSpotContactCreatorComponent": "hubspot_contact_creator",
+}
 
 __all__ = [
     "HubSpotNoteCreator",
     "HubSpotFileUploader",
     "HubSpotContactFetcher",
+    "HubSpotContactBatchFetcher",
     "HubSpotCompanyFetcher",
     "HubSpotContactUpdater",
     "HubSpotContactSearchComponent",
@@ -19,3 +41,21 @@ __all__ = [
     "HubSpotPropertyUpdateComponent",
     "HubSpotContactCreatorComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    """Lazily import HubSpot components on attribute access."""
+    if attr_name not in _dynamic_imports:
+        msg = f"module '{__name__}' has no attribute '{attr_name}'"
+        raise AttributeError(msg)
+    try:
+        result = import_mod(attr_name, _dynamic_imports[attr_name], __spec__.parent)
+    except (ModuleNotFoundError, ImportError, AttributeError) as e:
+        msg = f"Could not import '{attr_name}' from '{__name__}': {e}"
+        raise AttributeError(msg) from e
+    globals()[attr_name] = result
+    return result
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
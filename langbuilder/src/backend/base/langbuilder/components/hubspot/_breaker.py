@@ -0,0 +1,84 @@
+"""Per-host circuit breaker for the HubSpot components.
+
+When HubSpot is down every call would otherwise wait for its full timeout
+(15-30s) before failing. After FAILURE_THRESHOLD consecutive failures
+(transport errors or 5xx responses) the breaker for that host opens and
+calls fail immediately. After RESET_TIMEOUT seconds one trial request is
+let through (half-open); its outcome closes or re-opens the breaker.
+
+Author: CloudGeometry
+"""
+
+import threading
+import time
+
+import httpx
+
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request while the breaker for its host is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker shared by all requests to one host."""
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self.opened_at: float | None = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return CLOSED
+        return HALF_OPEN if self._trial else OPEN
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now; grants one trial per RESET_TIMEOUT while open."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at < self.reset_timeout:
+                return False
+            # Restarting the clock means a lost trial (e.g. a cancelled request)
+            # only blocks the next one for another RESET_TIMEOUT
+            self.opened_at = now
+            self._trial = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failure_count = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failure_count += 1
+            if self._trial or self.failure_count >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self._trial = False
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """Return the breaker for host, creating it on first use."""
+    with _registry_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker()
+        return breaker
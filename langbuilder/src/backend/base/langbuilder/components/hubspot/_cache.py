@@ -0,0 +1,68 @@
+"""Response caches for the HubSpot components.
+
+Company and contact records rarely change during an agent session, so
+repeated reads of the same object (e.g. on workflow replays) are served
+from memory instead of another round-trip to HubSpot. Slow-changing
+records (company properties) can also be kept on disk across runs.
+
+Author: CloudGeometry
+"""
+
+import copy
+import hashlib
+import threading
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from cachetools import TLRUCache
+from diskcache import Cache
+from platformdirs import user_cache_dir
+
+DEFAULT_TTL = 300
+PERSISTENT_SIZE_LIMIT = 64 * 1024 * 1024
+
+# Entries are stored as (ttl, value) so each component can pick its own TTL.
+# Values are deep-copied in and out: the payload a component returns (and
+# wraps in Data) is mutable, so sharing it would let callers edit the cache.
+_cache: TLRUCache = TLRUCache(maxsize=1024, ttu=lambda _key, value, now: now + value[0])
+_lock = threading.Lock()
+
+
+def make_key(api_key: str, object_type: str, object_id: str, *parts: Any) -> tuple:
+    """Build a cache key without keeping the raw API key in memory."""
+    key_hash = hashlib.blake2b(api_key.encode(), digest_size=8).digest()
+    return (key_hash, object_type, str(object_id), *parts)
+
+
+def get_cached(key: tuple) -> dict | None:
+    """Return a private copy of the cached payload for key, or None."""
+    with _lock:
+        entry = _cache.get(key)
+    return copy.deepcopy(entry[1]) if entry is not None else None
+
+
+def set_cached(key: tuple, value: dict, ttl: int = DEFAULT_TTL) -> None:
+    """Cache a successful payload for ttl seconds."""
+    if ttl <= 0:
+        return
+    value = copy.deepcopy(value)
+    with _lock:
+        _cache[key] = (ttl, value)
+
+
+@cache
+def _persistent_cache() -> Cache:
+    """Open the on-disk cache on first use."""
+    return Cache(str(Path(user_cache_dir("langbuilder")) / "hubspot"), size_limit=PERSISTENT_SIZE_LIMIT)
+
+
+def get_persistent(key: tuple) -> dict | None:
+    """Return the payload cached on disk for key, or None. Blocking; call via asyncio.to_thread."""
+    return _persistent_cache().get(key)
+
+
+def set_persistent(key: tuple, value: dict, ttl: int) -> None:
+    """Cache a payload on disk for ttl seconds. Blocking; call via asyncio.to_thread."""
+    if ttl > 0:
+        _persistent_cache().set(key, value, expire=ttl)
@@ -0,0 +1,179 @@
+"""Shared HTTP client for the HubSpot components.
+
+All HubSpot components talk to the same host, so they share one pooled
+HTTP/2 client instead of opening a new connection per call. Credentials
+are passed per request since the API key is configured per component.
+Rate-limited (429) and transient server errors are retried with
+jittered exponential backoff (honouring Retry-After up to
+MAX_RETRY_DELAY) inside the client's transport; client errors such as
+400/401/403 are never retried. The
+transport also caps the number of in-flight requests
+(HUBSPOT_MAX_CONCURRENCY, default 5) so parallel flows do not trip
+HubSpot's rate limit, and fails fast through a per-host circuit breaker
+(see _breaker) while HubSpot is unavailable.
+
+Author: CloudGeometry
+"""
+
+import asyncio
+import contextlib
+import os
+import random
+from weakref import WeakKeyDictionary
+
+import httpx
+from loguru import logger
+
+from langbuilder.components.hubspot._breaker import CircuitOpenError, get_breaker
+
+HUBSPOT_API_URL = "https://api.hubapi.com"
+COMPANIES_URL = f"{HUBSPOT_API_URL}/crm/v3/objects/companies/"
+CONTACTS_URL = f"{HUBSPOT_API_URL}/crm/v3/objects/contacts/"
+DEFAULT_TIMEOUT = 15.0
+
+# Company properties read by the company fetcher and by the contact fetcher's
+# primary-company lookup
+COMPANY_PROPERTIES = (
+    "name",
+    "domain",
+    "industry",
+    "annualrevenue",
+    "numberofemployees",
+    "city",
+    "state",
+    "country",
+    "phone",
+    "website",
+    "description",
+    "type",
+    "lifecyclestage",
+    "hs_lead_status",
+)
+COMPANY_PARAMS = httpx.QueryParams({"properties": ",".join(COMPANY_PROPERTIES)})
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Server errors are only retried for requests that are safe to repeat. HubSpot
+# PATCH requests set absolute property values, so repeating one is harmless.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"})
+# HubSpot POST endpoints that only read data
+READ_ONLY_POST_SUFFIXES = ("/search", "/batch/read")
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+# Longest Retry-After honoured; a longer wait returns the response instead
+MAX_RETRY_DELAY = 30.0
+DEFAULT_MAX_CONCURRENCY = 5
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float | None:
+    """Jittered exponential backoff, never shorter than Retry-After.
+
+    Returns None when Retry-After asks for more than MAX_RETRY_DELAY, so the
+    response goes back to the caller instead of stalling the request.
+    """
+    delay = min(BACKOFF_BASE * 2 ** (attempt - 1), BACKOFF_MAX) * random.uniform(0.5, 1.0)  # noqa: S311
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        with contextlib.suppress(ValueError):
+            delay = max(delay, float(retry_after))
+    return delay if delay <= MAX_RETRY_DELAY else None
+
+
+def _is_retry_safe(request: httpx.Request) -> bool:
+    """Whether a request can be re-sent after a 5xx without side effects."""
+    if request.method in IDEMPOTENT_METHODS:
+        return True
+    return request.method == "POST" and request.url.path.endswith(READ_ONLY_POST_SUFFIXES)
+
+
+class _RetryTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that bounds concurrency, retries rate limits and 5xx responses, and trips the breaker."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_concurrency: int):
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._version_logged = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = get_breaker(request.url.host)
+        if not breaker.allow_request():
+            msg = f"HubSpot circuit open for {request.url.host}, failing fast"
+            raise CircuitOpenError(msg, request=request)
+
+        try:
+            response = await self._send_with_retries(request)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        if response.status_code >= httpx.codes.INTERNAL_SERVER_ERROR:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def _send_with_retries(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            # Hold a slot only while the request is in flight, not during backoff
+            async with self._semaphore:
+                response = await self._transport.handle_async_request(request)
+            if not self._version_logged:
+                self._version_logged = True
+                logger.debug(f"HubSpot client negotiated {response.extensions.get('http_version', b'?').decode()}")
+            retryable = response.status_code == httpx.codes.TOO_MANY_REQUESTS or (
+                response.status_code in RETRY_STATUSES and _is_retry_safe(request)
+            )
+            if not retryable or attempt == MAX_ATTEMPTS:
+                return response
+            delay = _retry_delay(response, attempt)
+            if delay is None:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# Pooled connections belong to the loop that opened them, so each loop gets its
+# own client. Entries go away with their loop instead of being replaced (and
+# leaked) when a component runs on a different loop.
+_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = WeakKeyDictionary()
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HubSpot client for the running event loop.
+
+    A client is created on first use in each loop (e.g. a component run
+    through asyncio.run) and again after the loop's client was closed.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,  # connection failures only
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        max_concurrency = int(os.getenv("HUBSPOT_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY)))
+        client = httpx.AsyncClient(
+            transport=_RetryTransport(transport, max(1, max_concurrency)),
+            timeout=DEFAULT_TIMEOUT,
+        )
+        _clients[loop] = client
+    return client
+
+
+async def aclose_client() -> None:
+    """Close the running loop's shared client, e.g. on application shutdown."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def auth_headers(api_key: str) -> dict[str, str]:
+    """Build the per-request headers for a HubSpot private app key."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
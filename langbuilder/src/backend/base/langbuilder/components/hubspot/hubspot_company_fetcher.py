@@ -8,10 +8,25 @@ Author: CloudGeometry
 Project: Carter's Agents - Content Engine
 """
 
+import bisect
+
+from langbuilder.components.hubspot._cache import DEFAULT_TTL, get_cached, make_key, set_cached
+from langbuilder.components.hubspot._client import (
+    COMPANIES_URL,
+    COMPANY_PARAMS,
+    COMPANY_PROPERTIES,
+    auth_headers,
+    get_client,
+)
 from langbuilder.custom import Component
-from langbuilder.io import StrInput, SecretStrInput, Output
+from langbuilder.io import StrInput, SecretStrInput, BoolInput, IntInput, Output
 from langbuilder.schema import Data
 import httpx
+import orjson
+
+# Company size classification: 1-50 small, 51-500 mid, 500+ enterprise
+_SIZE_EDGES = (50, 500)
+_SIZE_LABELS = ("small", "mid", "enterprise")
 
 
 class HubSpotCompanyFetcher(Component):
@@ -30,12 +45,13 @@ class HubSpotCompanyFetcher(Component):
     name = "HubSpotCompanyFetcher"
 
     # Default properties to fetch
-    DEFAULT_PROPERTIES = [
+    DEFAULT_PROPERTIES = COMPANY_PROPERTIES
+
+    # String properties copied into the result as-is (empty when missing)
+    _TEXT_FIELDS = (
         "name",
         "domain",
         "industry",
-        "annualrevenue",
-        "numberofemployees",
         "city",
         "state",
         "country",
@@ -45,14 +61,7 @@ class HubSpotCompanyFetcher(Component):
         "type",
         "lifecyclestage",
         "hs_lead_status",
-    ]
-
-    # Company size classification thresholds
-    SIZE_THRESHOLDS = {
-        "small": 50,       # 1-50 employees
-        "mid": 500,        # 51-500 employees
-        "enterprise": None # 500+ employees
-    }
+    )
 
     inputs = [
         SecretStrInput(
@@ -74,6 +83,31 @@ class HubSpotCompanyFetcher(Component):
             info="Comma-separated list of properties to fetch (leave empty for defaults)",
             advanced=True
         ),
+        BoolInput(
+            name="raw_properties_only",
+            display_name="Raw Properties Only",
+            required=False,
+            value=False,
+            info="Replace the formatted output with only the id and the raw HubSpot properties under "
+            "all_properties (custom properties always get the raw map next to the formatted fields)",
+            advanced=True
+        ),
+        BoolInput(
+            name="cache_enabled",
+            display_name="Cache Results",
+            required=False,
+            value=True,
+            info="Reuse recent results for the same company instead of calling HubSpot again",
+            advanced=True
+        ),
+        IntInput(
+            name="cache_ttl",
+            display_name="Cache TTL (seconds)",
+            required=False,
+            value=DEFAULT_TTL,
+            info="How long cached company data stays valid",
+            advanced=True
+        ),
     ]
 
     outputs = [
@@ -90,14 +124,9 @@ class HubSpotCompanyFetcher(Component):
             return "unknown"
         try:
             count = int(num_employees)
-            if count <= self.SIZE_THRESHOLDS["small"]:
-                return "small"
-            elif count <= self.SIZE_THRESHOLDS["mid"]:
-                return "mid"
-            else:
-                return "enterprise"
         except (ValueError, TypeError):
             return "unknown"
+        return _SIZE_LABELS[bisect.bisect_left(_SIZE_EDGES, count)]
 
     def _estimate_cloud_spend(self, annual_revenue) -> int:
         """
@@ -118,111 +147,126 @@ class HubSpotCompanyFetcher(Component):
         parts = [p for p in [city, state, country] if p]
         return ", ".join(parts) if parts else ""
 
+    @staticmethod
+    def _company_label(company: dict) -> str:
+        """Name shown in the status line, from flattened or raw-only company data."""
+        return company.get("all_properties", company).get("name") or str(company.get("id"))
+
+    def _company_result(self, company_data: dict, properties: list, cache_key: tuple) -> Data:
+        """Wrap fetched company data, caching it when enabled."""
+        self.status = f"✅ Fetched: {self._company_label(company_data)}"
+
+        result_data = {
+            "success": True,
+            "company": company_data,
+            "company_id": self.company_id,
+            "properties_fetched": properties,
+        }
+        if self.cache_enabled:
+            set_cached(cache_key, result_data, self.cache_ttl)
+
+        return Data(data=result_data)
+
     async def fetch_company(self) -> Data:
         """
         Fetch company data from HubSpot CRM API.
 
         Returns:
             Data object with company properties, size classification,
-            and estimated cloud spend
+            and estimated cloud spend (an int; display formatting is
+            left to the consumer)
         """
         # Determine which properties to fetch
         if self.properties and self.properties.strip():
             properties = [p.strip() for p in self.properties.split(",")]
+            params = {"properties": ",".join(properties)}
         else:
             properties = self.DEFAULT_PROPERTIES
+            params = COMPANY_PARAMS
+
+        # Raw mode returns only the raw map; custom properties are only available
+        # in the raw map, so keep it next to the flattened fields for them
+        raw_only = bool(self.raw_properties_only)
+        include_raw = properties is not self.DEFAULT_PROPERTIES
+
+        # Serve repeat reads from the short-lived cache
+        cache_key = make_key(
+            self.hubspot_api_key, "companies", self.company_id, tuple(properties), include_raw, raw_only
+        )
+        if self.cache_enabled:
+            cached = get_cached(cache_key)
+            if cached is not None:
+                self.status = f"✅ Fetched (cached): {self._company_label(cached['company'])}"
+                return Data(data=cached)
 
         # Build URL
-        base_url = f"https://api.hubapi.com/crm/v3/objects/companies/{self.company_id}"
-
-        # Build query parameters
-        params = {
-            "properties": ",".join(properties),
-        }
+        base_url = COMPANIES_URL + str(self.company_id)
 
-        headers = {
-            "Authorization": f"Bearer {self.hubspot_api_key}",
-            "Content-Type": "application/json"
-        }
+        headers = auth_headers(self.hubspot_api_key)
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(base_url, headers=headers, params=params)
-
-                if response.status_code == 200:
-                    result = response.json()
-
-                    # Extract properties
-                    props = result.get("properties", {})
-
-                    # Get employee count and revenue for derived fields
-                    num_employees = props.get("numberofemployees")
-                    annual_revenue = props.get("annualrevenue")
+            client = get_client()
+            response = await client.get(base_url, headers=headers, params=params)
 
-                    # Classify company size
-                    company_size = self._classify_company_size(num_employees)
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
 
-                    # Estimate cloud spend
-                    estimated_cloud_spend = self._estimate_cloud_spend(annual_revenue)
-
-                    # Format location
-                    location = self._format_location(
-                        props.get("city", ""),
-                        props.get("state", ""),
-                        props.get("country", "")
+                # Extract properties
+                props = result.get("properties", {})
+                if raw_only:
+                    return self._company_result(
+                        {"id": result.get("id"), "all_properties": props}, properties, cache_key
                     )
 
-                    # Build company data object
-                    company_data = {
-                        "id": result.get("id"),
-                        "name": props.get("name", ""),
-                        "domain": props.get("domain", ""),
-                        "industry": props.get("industry", ""),
-                        "annualrevenue": annual_revenue,
-                        "numberofemployees": num_employees,
-                        "city": props.get("city", ""),
-                        "state": props.get("state", ""),
-                        "country": props.get("country", ""),
-                        "location": location,
-                        "phone": props.get("phone", ""),
-                        "website": props.get("website", ""),
-                        "description": props.get("description", ""),
-                        "type": props.get("type", ""),
-                        "lifecyclestage": props.get("lifecyclestage", ""),
-                        "hs_lead_status": props.get("hs_lead_status", ""),
-                        # Derived fields
-                        "company_size": company_size,
-                        "estimated_cloud_spend": estimated_cloud_spend,
-                        "estimated_cloud_spend_formatted": f"${estimated_cloud_spend:,}" if estimated_cloud_spend else "N/A",
-                        # Include all fetched properties
-                        "all_properties": props,
-                    }
-
-                    self.status = f"✅ Fetched: {company_data['name']}"
-
-                    return Data(data={
-                        "success": True,
-                        "company": company_data,
-                        "company_id": self.company_id,
-                        "properties_fetched": properties,
-                    })
-
-                elif response.status_code == 404:
-                    self.status = "❌ Company not found"
-                    return Data(data={
-                        "success": False,
-                        "error": f"Company {self.company_id} not found",
-                        "status_code": 404
-                    })
-
-                else:
-                    error_text = response.text
-                    self.status = f"❌ Error: {response.status_code}"
-                    return Data(data={
-                        "success": False,
-                        "error": error_text,
-                        "status_code": response.status_code
-                    })
+                # Get employee count and revenue for derived fields
+                num_employees = props.get("numberofemployees")
+                annual_revenue = props.get("annualrevenue")
+
+                # Classify company size
+                company_size = self._classify_company_size(num_employees)
+
+                # Estimate cloud spend
+                estimated_cloud_spend = self._estimate_cloud_spend(annual_revenue)
+
+                # Format location
+                location = self._format_location(
+                    props.get("city", ""),
+                    props.get("state", ""),
+                    props.get("country", "")
+                )
+
+                # Build company data object
+                company_data = {
+                    "id": result.get("id"),
+                    **{field: props.get(field, "") for field in self._TEXT_FIELDS},
+                    "annualrevenue": annual_revenue,
+                    "numberofemployees": num_employees,
+                    "location": location,
+                    # Derived fields
+                    "company_size": company_size,
+                    "estimated_cloud_spend": estimated_cloud_spend,
+                }
+                if include_raw:
+                    company_data["all_properties"] = props
+
+                return self._company_result(company_data, properties, cache_key)
+
+            elif response.status_code == 404:
+                self.status = "❌ Company not found"
+                return Data(data={
+                    "success": False,
+                    "error": f"Company {self.company_id} not found",
+                    "status_code": 404
+                })
+
+            else:
+                error_text = response.text
+                self.status = f"❌ Error: {response.status_code}"
+                return Data(data={
+                    "success": False,
+                    "error": error_text,
+                    "status_code": response.status_code
+                })
 
         except httpx.TimeoutException:
             self.status = "❌ Request timeout"
@@ -0,0 +1,176 @@
+"""HubSpot Contact Batch Fetcher - LangBuilder Custom Component.
+
+Fetches many contacts from HubSpot CRM API v3 in as few requests as
+possible using the batch read endpoint (up to 100 records per call).
+
+Author: CloudGeometry
+Project: Carter's Agents - Content Engine
+"""
+
+import asyncio
+
+import httpx
+import orjson
+
+from langbuilder.components.hubspot._client import CONTACTS_URL, auth_headers, get_client
+from langbuilder.components.hubspot.hubspot_contact_fetcher import HubSpotContactFetcher, build_contact_data
+from langbuilder.custom import Component
+from langbuilder.io import HandleInput, Output, SecretStrInput, StrInput
+from langbuilder.schema import Data
+
+_BATCH_READ_URL = CONTACTS_URL + "batch/read"
+
+
+class HubSpotContactBatchFetcher(Component):
+    """Fetches multiple contacts from HubSpot CRM in batches.
+
+    Accepts contact IDs from upstream Data (a `contact_ids` list, a
+    `contacts` list, or single `contact_id`/`id` values) and reads them
+    via POST /crm/v3/objects/contacts/batch/read, 100 IDs per request,
+    with all batches sent concurrently.
+    """
+
+    display_name = "HubSpot Contact Batch Fetcher"
+    description = "Fetches multiple contacts from HubSpot CRM in batched requests"
+    icon = "users"
+    name = "HubSpotContactBatchFetcher"
+
+    # HubSpot batch read limit
+    BATCH_SIZE = 100
+
+    inputs = [
+        SecretStrInput(
+            name="hubspot_api_key",
+            display_name="HubSpot API Key",
+            required=True,
+            info="HubSpot Private App API key with crm.objects.contacts.read scope",
+        ),
+        HandleInput(
+            name="contact_ids",
+            display_name="Contact IDs",
+            input_types=["Data"],
+            required=True,
+            is_list=True,
+            info="Data with a contact_ids list, a contacts list, or contact_id/id values",
+        ),
+        StrInput(
+            name="properties",
+            display_name="Properties",
+            required=False,
+            info="Comma-separated list of properties to fetch (leave empty for defaults)",
+            advanced=True,
+        ),
+    ]
+
+    outputs = [
+        Output(
+            name="contacts",
+            display_name="Contacts",
+            method="fetch_contacts",
+        ),
+    ]
+
+    def _extract_contact_ids(self) -> list[str]:
+        """Collect unique contact IDs from the connected Data inputs."""
+        inputs = self.contact_ids if isinstance(self.contact_ids, list) else [self.contact_ids]
+        ids = []
+        for item in inputs:
+            data = item.data if hasattr(item, "data") else item
+            if not isinstance(data, dict):
+                continue
+            if isinstance(data.get("contact_ids"), list):
+                ids.extend(data["contact_ids"])
+            elif isinstance(data.get("contacts"), list):
+                ids.extend(c.get("id") for c in data["contacts"] if isinstance(c, dict))
+            else:
+                ids.append(data.get("contact_id") or data.get("id"))
+        # Deduplicate while keeping the upstream order
+        return list(dict.fromkeys(str(i) for i in ids if i))
+
+    async def _read_batch(self, client: httpx.AsyncClient, url: str, headers: dict, properties, ids) -> dict:
+        """Read one batch of up to BATCH_SIZE contacts."""
+        payload = {
+            "properties": list(properties),
+            "inputs": [{"id": contact_id} for contact_id in ids],
+        }
+        response = await client.post(url, headers=headers, content=orjson.dumps(payload))
+
+        # 207 Multi-Status: some IDs were not found, the rest are in results
+        if response.status_code in (200, 207):
+            return orjson.loads(response.content)
+
+        return {"results": [], "errors": [{"status": response.status_code, "message": response.text, "ids": ids}]}
+
+    async def fetch_contacts(self) -> Data:
+        """Fetch all requested contacts from HubSpot CRM API.
+
+        Returns:
+            Data object with the list of contacts and any per-batch errors
+        """
+        contact_ids = self._extract_contact_ids()
+        if not contact_ids:
+            self.status = "❌ No contact IDs provided"
+            return Data(
+                data={
+                    "success": False,
+                    "error": "No contact IDs found in input",
+                    "contacts": [],
+                }
+            )
+
+        # Determine which properties to fetch
+        if self.properties and self.properties.strip():
+            properties = [p.strip() for p in self.properties.split(",")]
+        else:
+            properties = HubSpotContactFetcher.DEFAULT_PROPERTIES
+
+        headers = auth_headers(self.hubspot_api_key)
+        batches = [contact_ids[i : i + self.BATCH_SIZE] for i in range(0, len(contact_ids), self.BATCH_SIZE)]
+
+        try:
+            client = get_client()
+            responses = await asyncio.gather(
+                *(self._read_batch(client, _BATCH_READ_URL, headers, properties, batch) for batch in batches)
+            )
+
+        except httpx.TimeoutException:
+            self.status = "❌ Request timeout"
+            return Data(
+                data={
+                    "success": False,
+                    "error": "Request timed out after 15 seconds",
+                    "contacts": [],
+                }
+            )
+
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            self.status = f"❌ Error: {str(e)[:50]}"
+            return Data(
+                data={
+                    "success": False,
+                    "error": str(e),
+                    "contacts": [],
+                }
+            )
+
+        # Custom properties are only available in the raw map, so keep it for them
+        include_raw = properties is not HubSpotContactFetcher.DEFAULT_PROPERTIES
+        contacts = [
+            build_contact_data(r, include_raw_properties=include_raw)
+            for resp in responses
+            for r in resp.get("results", [])
+        ]
+        errors = [e for resp in responses for e in resp.get("errors", [])]
+
+        self.status = f"✅ Fetched {len(contacts)} of {len(contact_ids)} contacts"
+
+        return Data(
+            data={
+                "success": bool(contacts) or not errors,
+                "contacts": contacts,
+                "contact_count": len(contacts),
+                "requested_count": len(contact_ids),
+                "errors": errors,
+                "properties_fetched": properties,
+            }
+        )
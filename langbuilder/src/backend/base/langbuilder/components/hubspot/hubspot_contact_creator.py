@@ -9,12 +9,13 @@ Author: CloudGeometry
 Project: Carter's Agents - ICP Validator
 """
 
+from langbuilder.components.hubspot._client import HUBSPOT_API_URL, auth_headers, get_client
 from langbuilder.custom import Component
 from langbuilder.io import HandleInput, SecretStrInput, StrInput, Output
 from langbuilder.schema import Data
 # ValueError not used
 from loguru import logger
-import httpx
+import orjson
 
 
 class HubSpotContactCreatorComponent(Component):
@@ -35,6 +36,18 @@ class HubSpotContactCreatorComponent(Component):
     icon = "user-plus"
     name = "HubSpotContactCreator"
 
+    # HubSpot property -> Apollo/input keys to read it from, in priority order
+    _FIELD_MAP = (
+        ("firstname", ("first_name", "firstname")),
+        ("lastname", ("last_name", "lastname")),
+        ("email", ("email",)),
+        ("jobtitle", ("title", "jobtitle")),
+        ("city", ("city",)),
+        ("state", ("state",)),
+        ("country", ("country",)),
+        ("hs_linkedin_url", ("linkedin_url",)),
+    )
+
     inputs = [
         HandleInput(
             name="contact_data",
@@ -104,21 +117,13 @@ class HubSpotContactCreatorComponent(Component):
                     if "people" in data and data["people"]:
                         person = data["people"][0]
 
-                # Extract fields with Apollo → HubSpot mapping
-                contact_info = {
-                    "firstname": person.get("first_name") or person.get("firstname", ""),
-                    "lastname": person.get("last_name") or person.get("lastname", ""),
-                    "email": person.get("email", ""),
-                    "jobtitle": person.get("title") or person.get("jobtitle", ""),
-                    "city": person.get("city", ""),
-                    "state": person.get("state", ""),
-                    "country": person.get("country", ""),
-                }
-
-                # Add LinkedIn if available
-                linkedin = person.get("linkedin_url")
-                if linkedin:
-                    contact_info["hs_linkedin_url"] = linkedin
+                # Extract fields with Apollo → HubSpot mapping (first non-empty source wins)
+                for hs_key, source_keys in self._FIELD_MAP:
+                    for key in source_keys:
+                        value = person.get(key)
+                        if value:
+                            contact_info[hs_key] = value
+                            break
 
                 # Add lead source
                 if self.lead_source:
@@ -176,18 +181,13 @@ class HubSpotContactCreatorComponent(Component):
                 "Contact requires either email or (firstname + lastname)"
             )
 
-        base_url = self.base_url or "https://api.hubapi.com"
+        base_url = self.base_url or HUBSPOT_API_URL
         url = f"{base_url}/crm/v3/objects/contacts"
 
-        headers = {
-            "Authorization": f"Bearer {self.hubspot_api_key}",
-            "Content-Type": "application/json",
-        }
+        headers = auth_headers(self.hubspot_api_key)
 
-        # Build payload
-        payload = {
-            "properties": {k: v for k, v in contact_info.items() if v}
-        }
+        # Build payload (_extract_contact_info only sets non-empty values)
+        payload = {"properties": contact_info}
 
         # Add company association if provided
         # Association Type ID 279 = Contact to Company (HubSpot-defined)
@@ -205,84 +205,84 @@ class HubSpotContactCreatorComponent(Component):
             ]
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers, json=payload)
-
-                if response.status_code in [200, 201]:
-                    result = response.json()
-                    new_contact_id = result.get("id")
-
-                    # Build HubSpot URL
-                    hubspot_url = (
-                        f"https://app.hubspot.com/contacts/contacts/{new_contact_id}"
-                    )
-
-                    contact_name = (
-                        f"{contact_info.get('firstname', '')} "
-                        f"{contact_info.get('lastname', '')}".strip()
-                    )
-                    self.status = f"Created: {contact_name}"
-
-                    logger.info(
-                        f"HubSpot contact created: {new_contact_id} "
-                        f"({contact_name}, {contact_info.get('jobtitle', 'No title')})"
-                    )
+            client = get_client()
+            response = await client.post(url, headers=headers, content=orjson.dumps(payload), timeout=30.0)
+
+            if response.status_code in [200, 201]:
+                result = orjson.loads(response.content)
+                new_contact_id = result.get("id")
+
+                # Build HubSpot URL
+                hubspot_url = (
+                    f"https://app.hubspot.com/contacts/contacts/{new_contact_id}"
+                )
+
+                contact_name = (
+                    f"{contact_info.get('firstname', '')} "
+                    f"{contact_info.get('lastname', '')}".strip()
+                )
+                self.status = f"Created: {contact_name}"
+
+                logger.info(
+                    f"HubSpot contact created: {new_contact_id} "
+                    f"({contact_name}, {contact_info.get('jobtitle', 'No title')})"
+                )
+
+                return Data(
+                    data={
+                        "success": True,
+                        "contact_id": new_contact_id,
+                        "hubspot_url": hubspot_url,
+                        "properties": contact_info,
+                        "company_id": company_id,
+                        "name": contact_name,
+                        "email": contact_info.get("email", ""),
+                        "title": contact_info.get("jobtitle", ""),
+                    }
+                )
+
+            elif response.status_code == 409:
+                # Contact already exists (duplicate email)
+                try:
+                    error_data = orjson.loads(response.content)
+                    existing_id = error_data.get("message", "").split("ID: ")[-1]
+                    self.status = f"Duplicate - exists: {existing_id}"
 
                     return Data(
                         data={
-                            "success": True,
-                            "contact_id": new_contact_id,
-                            "hubspot_url": hubspot_url,
-                            "properties": contact_info,
-                            "company_id": company_id,
-                            "name": contact_name,
-                            "email": contact_info.get("email", ""),
-                            "title": contact_info.get("jobtitle", ""),
+                            "success": False,
+                            "error": "Contact already exists",
+                            "existing_contact_id": existing_id.strip(),
+                            "email": contact_info.get("email"),
                         }
                     )
-
-                elif response.status_code == 409:
-                    # Contact already exists (duplicate email)
-                    try:
-                        error_data = response.json()
-                        existing_id = error_data.get("message", "").split("ID: ")[-1]
-                        self.status = f"Duplicate - exists: {existing_id}"
-
-                        return Data(
-                            data={
-                                "success": False,
-                                "error": "Contact already exists",
-                                "existing_contact_id": existing_id.strip(),
-                                "email": contact_info.get("email"),
-                            }
-                        )
-                    except Exception:
-                        pass
-
-                    self.status = "Duplicate contact"
-                    raise ValueError("Contact already exists in HubSpot")
-
-                elif response.status_code == 401:
-                    self.status = "Authentication failed"
-                    raise ValueError("HubSpot authentication failed - check API key")
-
-                elif response.status_code == 403:
-                    self.status = "Permission denied"
-                    raise ValueError(
-                        "HubSpot permission denied - ensure crm.objects.contacts.write scope"
-                    )
-
-                else:
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get("message", response.text)
-                    except Exception:
-                        error_msg = response.text
-
-                    self.status = f"Error: {response.status_code}"
-                    raise ValueError(
-                        f"HubSpot contact creation failed ({response.status_code}): {error_msg}"
-                    )
+                except Exception:
+                    pass
+
+                self.status = "Duplicate contact"
+                raise ValueError("Contact already exists in HubSpot")
+
+            elif response.status_code == 401:
+                self.status = "Authentication failed"
+                raise ValueError("HubSpot authentication failed - check API key")
+
+            elif response.status_code == 403:
+                self.status = "Permission denied"
+                raise ValueError(
+                    "HubSpot permission denied - ensure crm.objects.contacts.write scope"
+                )
+
+            else:
+                try:
+                    error_data = orjson.loads(response.content)
+                    error_msg = error_data.get("message", response.text)
+                except Exception:
+                    error_msg = response.text
+
+                self.status = f"Error: {response.status_code}"
+                raise ValueError(
+                    f"HubSpot contact creation failed ({response.status_code}): {error_msg}"
+                )
 
         except ValueError:
             raise
@@ -8,10 +8,50 @@ Author: CloudGeometry
 Project: Carter's Agents - Content Engine
 """
 
+from langbuilder.components.hubspot._cache import DEFAULT_TTL, get_cached, make_key, set_cached
+from langbuilder.components.hubspot._client import (
+    COMPANIES_URL,
+    COMPANY_PARAMS,
+    CONTACTS_URL,
+    auth_headers,
+    get_client,
+)
 from langbuilder.custom import Component
-from langbuilder.io import StrInput, SecretStrInput, BoolInput, Output
+from langbuilder.io import StrInput, SecretStrInput, BoolInput, IntInput, Output
 from langbuilder.schema import Data
 import httpx
+import orjson
+
+
+def build_contact_data(result: dict, *, include_raw_properties: bool = False, raw_only: bool = False) -> dict:
+    """Flatten a HubSpot contact object into the fields used downstream.
+
+    raw_only returns just the id and the raw properties map; include_raw_properties
+    adds the raw map next to the flattened fields (needed for custom properties).
+    """
+    props = result.get("properties", {})
+    if raw_only:
+        return {"id": result.get("id"), "all_properties": props}
+    contact_data = {
+        "id": result.get("id"),
+        "firstname": props.get("firstname", ""),
+        "lastname": props.get("lastname", ""),
+        "full_name": f"{props.get('firstname', '')} {props.get('lastname', '')}".strip(),
+        "email": props.get("email", ""),
+        "jobtitle": props.get("jobtitle", ""),
+        "company": props.get("company", ""),
+        "industry": props.get("industry", ""),
+        "phone": props.get("phone", ""),
+        "city": props.get("city", ""),
+        "state": props.get("state", ""),
+        "country": props.get("country", ""),
+        "annualrevenue": props.get("annualrevenue"),
+        "lifecyclestage": props.get("lifecyclestage", ""),
+        "hs_lead_status": props.get("hs_lead_status", ""),
+    }
+    if include_raw_properties:
+        contact_data["all_properties"] = props
+    return contact_data
 
 
 class HubSpotContactFetcher(Component):
@@ -29,7 +69,7 @@ class HubSpotContactFetcher(Component):
     name = "HubSpotContactFetcher"
 
     # Default properties to fetch
-    DEFAULT_PROPERTIES = [
+    DEFAULT_PROPERTIES = (
         "firstname",
         "lastname",
         "email",
@@ -43,7 +83,10 @@ class HubSpotContactFetcher(Component):
         "annualrevenue",
         "lifecyclestage",
         "hs_lead_status",
-    ]
+    )
+    _DEFAULT_PROPERTIES_STR = ",".join(DEFAULT_PROPERTIES)
+    _DEFAULT_PARAMS = httpx.QueryParams({"properties": _DEFAULT_PROPERTIES_STR})
+    _DEFAULT_PARAMS_WITH_COMPANIES = _DEFAULT_PARAMS.merge({"associations": "companies"})
 
     inputs = [
         SecretStrInput(
@@ -72,6 +115,39 @@ class HubSpotContactFetcher(Component):
             value=True,
             info="Whether to include associated company IDs in the response"
         ),
+        BoolInput(
+            name="fetch_primary_company",
+            display_name="Fetch Primary Company",
+            required=False,
+            value=False,
+            info="Also fetch the primary associated company (requires Include Company Association)",
+            advanced=True
+        ),
+        BoolInput(
+            name="raw_properties_only",
+            display_name="Raw Properties Only",
+            required=False,
+            value=False,
+            info="Replace the formatted output with only the id and the raw HubSpot properties under "
+            "all_properties (custom properties always get the raw map next to the formatted fields)",
+            advanced=True
+        ),
+        BoolInput(
+            name="cache_enabled",
+            display_name="Cache Results",
+            required=False,
+            value=True,
+            info="Reuse recent results for the same contact instead of calling HubSpot again",
+            advanced=True
+        ),
+        IntInput(
+            name="cache_ttl",
+            display_name="Cache TTL (seconds)",
+            required=False,
+            value=DEFAULT_TTL,
+            info="How long cached contact data stays valid",
+            advanced=True
+        ),
     ]
 
     outputs = [
@@ -82,6 +158,31 @@ class HubSpotContactFetcher(Component):
         ),
     ]
 
+    @staticmethod
+    def _contact_label(contact: dict) -> str:
+        """Name shown in the status line, from flattened or raw-only contact data."""
+        props = contact.get("all_properties", contact)
+        full_name = f"{props.get('firstname') or ''} {props.get('lastname') or ''}".strip()
+        return full_name or props.get("email") or str(contact.get("id"))
+
+    async def _fetch_company(self, client: httpx.AsyncClient, headers: dict, company_id: str) -> dict | None:
+        """Fetch the properties of an associated company, or None on failure."""
+        try:
+            response = await client.get(
+                COMPANIES_URL + company_id,
+                headers=headers,
+                params=COMPANY_PARAMS,
+            )
+        except httpx.HTTPError:
+            return None
+        if response.status_code != httpx.codes.OK:
+            return None
+        try:
+            result = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return None
+        return {"id": result.get("id"), **result.get("properties", {})}
+
     async def fetch_contact(self) -> Data:
         """
         Fetch contact data from HubSpot CRM API.
@@ -92,92 +193,93 @@ class HubSpotContactFetcher(Component):
         # Determine which properties to fetch
         if self.properties and self.properties.strip():
             properties = [p.strip() for p in self.properties.split(",")]
+            params = {"properties": ",".join(properties)}
+            # Add company associations if requested
+            if self.include_company_association:
+                params["associations"] = "companies"
         else:
             properties = self.DEFAULT_PROPERTIES
+            params = self._DEFAULT_PARAMS_WITH_COMPANIES if self.include_company_association else self._DEFAULT_PARAMS
 
-        # Build URL
-        base_url = f"https://api.hubapi.com/crm/v3/objects/contacts/{self.contact_id}"
+        # Raw mode returns only the raw map; custom properties are only available
+        # in the raw map, so keep it next to the flattened fields for them
+        raw_only = bool(self.raw_properties_only)
+        include_raw = properties is not self.DEFAULT_PROPERTIES
 
-        # Build query parameters
-        params = {
-            "properties": ",".join(properties),
-        }
+        # Serve repeat reads from the short-lived cache
+        cache_key = make_key(
+            self.hubspot_api_key, "contacts", self.contact_id, tuple(properties),
+            bool(self.include_company_association),
+            bool(self.fetch_primary_company),
+            include_raw,
+            raw_only,
+        )
+        if self.cache_enabled:
+            cached = get_cached(cache_key)
+            if cached is not None:
+                self.status = f"✅ Fetched (cached): {self._contact_label(cached['contact'])}"
+                return Data(data=cached)
 
-        # Add company associations if requested
-        if self.include_company_association:
-            params["associations"] = "companies"
+        # Build URL
+        base_url = CONTACTS_URL + str(self.contact_id)
 
-        headers = {
-            "Authorization": f"Bearer {self.hubspot_api_key}",
-            "Content-Type": "application/json"
-        }
+        headers = auth_headers(self.hubspot_api_key)
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(base_url, headers=headers, params=params)
-
-                if response.status_code == 200:
-                    result = response.json()
-
-                    # Extract properties
-                    props = result.get("properties", {})
-
-                    # Build contact data object
-                    contact_data = {
-                        "id": result.get("id"),
-                        "firstname": props.get("firstname", ""),
-                        "lastname": props.get("lastname", ""),
-                        "full_name": f"{props.get('firstname', '')} {props.get('lastname', '')}".strip(),
-                        "email": props.get("email", ""),
-                        "jobtitle": props.get("jobtitle", ""),
-                        "company": props.get("company", ""),
-                        "industry": props.get("industry", ""),
-                        "phone": props.get("phone", ""),
-                        "city": props.get("city", ""),
-                        "state": props.get("state", ""),
-                        "country": props.get("country", ""),
-                        "annualrevenue": props.get("annualrevenue"),
-                        "lifecyclestage": props.get("lifecyclestage", ""),
-                        "hs_lead_status": props.get("hs_lead_status", ""),
-                        # Include all fetched properties
-                        "all_properties": props,
-                    }
-
-                    # Extract company associations if present
-                    company_ids = []
-                    associations = result.get("associations", {})
-                    if "companies" in associations:
-                        company_results = associations["companies"].get("results", [])
-                        company_ids = [c.get("id") for c in company_results if c.get("id")]
-
-                    contact_data["associated_company_ids"] = company_ids
-                    contact_data["primary_company_id"] = company_ids[0] if company_ids else None
-
-                    self.status = f"✅ Fetched: {contact_data['full_name'] or contact_data['email']}"
-
-                    return Data(data={
-                        "success": True,
-                        "contact": contact_data,
-                        "contact_id": self.contact_id,
-                        "properties_fetched": properties,
-                    })
-
-                elif response.status_code == 404:
-                    self.status = "❌ Contact not found"
-                    return Data(data={
-                        "success": False,
-                        "error": f"Contact {self.contact_id} not found",
-                        "status_code": 404
-                    })
-
-                else:
-                    error_text = response.text
-                    self.status = f"❌ Error: {response.status_code}"
-                    return Data(data={
-                        "success": False,
-                        "error": error_text,
-                        "status_code": response.status_code
-                    })
+            client = get_client()
+            response = await client.get(base_url, headers=headers, params=params)
+
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+
+                # Extract company associations if present
+                company_ids = []
+                associations = result.get("associations", {})
+                if "companies" in associations:
+                    company_results = associations["companies"].get("results", [])
+                    company_ids = [c.get("id") for c in company_results if c.get("id")]
+
+                # Build contact data object
+                contact_data = build_contact_data(result, include_raw_properties=include_raw, raw_only=raw_only)
+                contact_data["associated_company_ids"] = company_ids
+                contact_data["primary_company_id"] = company_ids[0] if company_ids else None
+
+                company_failed = False
+                if self.fetch_primary_company and company_ids:
+                    primary_company = await self._fetch_company(client, headers, company_ids[0])
+                    contact_data["primary_company"] = primary_company
+                    company_failed = primary_company is None
+
+                self.status = f"✅ Fetched: {self._contact_label(contact_data)}"
+
+                result_data = {
+                    "success": True,
+                    "contact": contact_data,
+                    "contact_id": self.contact_id,
+                    "properties_fetched": properties,
+                }
+                # Don't cache a missing company; retry the lookup on the next run
+                if self.cache_enabled and not company_failed:
+                    set_cached(cache_key, result_data, self.cache_ttl)
+
+                return Data(data=result_data)
+
+            elif response.status_code == 404:
+                self.status = "❌ Contact not found"
+                return Data(data={
+                    "success": False,
+                    "error": f"Contact {self.contact_id} not found",
+                    "status_code": 404
+                })
+
+            else:
+                error_text = response.text
+                self.status = f"❌ Error: {response.status_code}"
+                return Data(data={
+                    "success": False,
+                    "error": error_text,
+                    "status_code": response.status_code
+                })
 
         except httpx.TimeoutException:
             self.status = "❌ Request timeout"
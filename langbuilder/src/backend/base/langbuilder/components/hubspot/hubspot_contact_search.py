@@ -7,12 +7,14 @@ Returns matching contacts with id, name, email, company, and job title.
 Author: CloudGeometry
 """
 
+from langbuilder.components.hubspot._cache import get_cached, make_key, set_cached
+from langbuilder.components.hubspot._client import HUBSPOT_API_URL, auth_headers, get_client
 from langbuilder.custom import Component
 from langbuilder.io import SecretStrInput, MessageTextInput, IntInput, Output, DataInput
 from langbuilder.schema import Data
 from langchain_core.tools import ToolException
 from loguru import logger
-import httpx
+import orjson
 
 
 class HubSpotContactSearchComponent(Component):
@@ -76,6 +78,14 @@ class HubSpotContactSearchComponent(Component):
             advanced=True,
             info="HubSpot API base URL",
         ),
+        IntInput(
+            name="cache_ttl",
+            display_name="Cache TTL (seconds)",
+            required=False,
+            value=300,
+            advanced=True,
+            info="Reuse results for the same query (ignoring case and spacing) for this many seconds (0 disables)",
+        ),
     ]
 
     outputs = [
@@ -86,6 +96,44 @@ class HubSpotContactSearchComponent(Component):
         ),
     ]
 
+    def _parsed_data_item(self):
+        """Return the parsed_data payload (first item for list inputs from DataConditionalRouter)."""
+        pd = self.parsed_data
+        if isinstance(pd, list) and len(pd) > 0:
+            pd = pd[0]
+        return pd.data if hasattr(pd, "data") else pd
+
+    def _extract_query(self) -> str:
+        """Return the search query from search_query or parsed_data, or an empty string."""
+        if self.search_query:
+            return str(self.search_query).strip()
+        if self.parsed_data:
+            data = self._parsed_data_item()
+            if isinstance(data, dict):
+                # Try search_query first (from Router), then contact_name, then text
+                return data.get("search_query", "") or data.get("contact_name", "") or data.get("text", "") or ""
+        return ""
+
+    def _describe_query_inputs(self) -> str:
+        """Describe the query inputs for the error raised when no query was found."""
+        if self.search_query:
+            return f"search_query='{str(self.search_query).strip()}'"
+        if not self.parsed_data:
+            return "NO parsed_data and NO search_query"
+
+        pd = self.parsed_data
+        debug_info = [f"parsed_data type={type(pd).__name__}"]
+        if isinstance(pd, list) and len(pd) > 0:
+            debug_info.append(f"list len={len(pd)}")
+        data = self._parsed_data_item()
+        debug_info.append(f"data type={type(data).__name__}")
+        if isinstance(data, dict):
+            debug_info.append(f"dict keys={list(data.keys())[:5]}")
+            debug_info.append("query=''")
+        else:
+            debug_info.append(f"data not dict: {str(data)[:50]}")
+        return "; ".join(debug_info)
+
     async def search(self) -> Data:
         """
         Search for contacts by name in HubSpot.
@@ -101,45 +149,26 @@ class HubSpotContactSearchComponent(Component):
             raise ToolException("HubSpot API key is required")
 
         # Get query from search_query or from parsed_data.contact_name/text
-        query = ""
-        debug_info = []
-
-        if self.search_query:
-            query = str(self.search_query).strip()
-            debug_info.append(f"search_query='{query}'")
-        elif self.parsed_data:
-            # Extract search query from parsed_data
-            # Handle list inputs (from DataConditionalRouter which returns lists)
-            pd = self.parsed_data
-            debug_info.append(f"parsed_data type={type(pd).__name__}")
-            if isinstance(pd, list) and len(pd) > 0:
-                debug_info.append(f"list len={len(pd)}")
-                pd = pd[0]  # Take first item from list
-            data = pd.data if hasattr(pd, 'data') else pd
-            debug_info.append(f"data type={type(data).__name__}")
-            if isinstance(data, dict):
-                debug_info.append(f"dict keys={list(data.keys())[:5]}")
-                # Try search_query first (from Router), then contact_name, then text
-                query = data.get("search_query", "") or data.get("contact_name", "") or data.get("text", "") or ""
-                debug_info.append(f"query='{query}'")
-            else:
-                debug_info.append(f"data not dict: {str(data)[:50]}")
-        else:
-            debug_info.append("NO parsed_data and NO search_query")
-
+        query = self._extract_query()
         if not query:
-            debug_str = "; ".join(debug_info)
-            raise ToolException(f"Search query is required. DEBUG: {debug_str}")
+            raise ToolException(f"Search query is required. DEBUG: {self._describe_query_inputs()}")
 
-        base_url = self.base_url or "https://api.hubapi.com"
+        base_url = self.base_url or HUBSPOT_API_URL
         limit = self.limit or 5
 
         url = f"{base_url}/crm/v3/objects/contacts/search"
 
-        headers = {
-            "Authorization": f"Bearer {self.hubspot_api_key}",
-            "Content-Type": "application/json",
-        }
+        # Queries differing only in case or spacing return the same HubSpot results
+        normalized_query = " ".join(query.casefold().split())
+        cache_key = make_key(self.hubspot_api_key, "search", normalized_query, base_url, limit)
+        if self.cache_ttl:
+            cached = get_cached(cache_key)
+            if cached is not None:
+                cached["query"] = query
+                self.status = f"Found {cached['count']} contact(s) (cached)"
+                return Data(data=cached)
+
+        headers = auth_headers(self.hubspot_api_key)
 
         # Use HubSpot's default search - searches across all text fields
         payload = {
@@ -149,67 +178,66 @@ class HubSpotContactSearchComponent(Component):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers, json=payload)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    contacts = []
-
-                    for contact in data.get("results", []):
-                        props = contact.get("properties", {})
-                        first = props.get("firstname", "") or ""
-                        last = props.get("lastname", "") or ""
-                        full_name = f"{first} {last}".strip()
-
-                        contacts.append(
-                            {
-                                "id": contact.get("id"),
-                                "name": full_name or "Unknown",
-                                "email": props.get("email", "") or "",
-                                "company": props.get("company", "") or "",
-                                "job_title": props.get("jobtitle", "") or "",
-                            }
-                        )
-
-                    # Determine selected contact (first match for automated flows)
-                    selected_id = contacts[0]["id"] if contacts else None
-
-                    self.status = f"Found {len(contacts)} contact(s)"
-                    logger.info(f"HubSpot search for '{query}' found {len(contacts)} contacts")
-
-                    return Data(
-                        data={
-                            "success": True,
-                            "contacts": contacts,
-                            "count": len(contacts),
-                            "query": query,
-                            "selected_contact_id": selected_id,
+            client = get_client()
+            response = await client.post(url, headers=headers, content=orjson.dumps(payload), timeout=30.0)
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                contacts = []
+
+                for contact in data.get("results", []):
+                    props_get = contact.get("properties", {}).get
+                    contacts.append(
+                        {
+                            "id": contact.get("id"),
+                            "name": " ".join(filter(None, (props_get("firstname"), props_get("lastname"))))
+                            or "Unknown",
+                            "email": props_get("email") or "",
+                            "company": props_get("company") or "",
+                            "job_title": props_get("jobtitle") or "",
                         }
                     )
 
-                elif response.status_code == 401:
-                    self.status = "Authentication failed"
-                    raise ToolException(
-                        "HubSpot authentication failed - check API key"
-                    )
-                elif response.status_code == 403:
-                    self.status = "Permission denied"
-                    raise ToolException(
-                        "HubSpot permission denied - ensure crm.objects.contacts.read scope"
-                    )
-                else:
-                    error_msg = response.text
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get("message", response.text)
-                    except Exception:
-                        pass
-
-                    self.status = f"Error: {response.status_code}"
-                    raise ToolException(
-                        f"HubSpot search failed ({response.status_code}): {error_msg}"
-                    )
+                # Determine selected contact (first match for automated flows)
+                selected_id = contacts[0]["id"] if contacts else None
+
+                self.status = f"Found {len(contacts)} contact(s)"
+                logger.info(f"HubSpot search for '{query}' found {len(contacts)} contacts")
+
+                result = {
+                    "success": True,
+                    "contacts": contacts,
+                    "count": len(contacts),
+                    "query": query,
+                    "selected_contact_id": selected_id,
+                }
+                if self.cache_ttl:
+                    set_cached(cache_key, result, self.cache_ttl)
+
+                return Data(data=result)
+
+            elif response.status_code == 401:
+                self.status = "Authentication failed"
+                raise ToolException(
+                    "HubSpot authentication failed - check API key"
+                )
+            elif response.status_code == 403:
+                self.status = "Permission denied"
+                raise ToolException(
+                    "HubSpot permission denied - ensure crm.objects.contacts.read scope"
+                )
+            else:
+                error_msg = response.text
+                try:
+                    error_data = orjson.loads(response.content)
+                    error_msg = error_data.get("message", response.text)
+                except Exception:
+                    pass
+
+                self.status = f"Error: {response.status_code}"
+                raise ToolException(
+                    f"HubSpot search failed ({response.status_code}): {error_msg}"
+                )
 
         except ToolException:
             raise
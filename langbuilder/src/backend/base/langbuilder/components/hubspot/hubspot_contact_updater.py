@@ -9,11 +9,14 @@ Author: CloudGeometry
 Project: Carter's Agents - Content Engine
 """
 
+import asyncio
+
+from langbuilder.components.hubspot._client import CONTACTS_URL, auth_headers, get_client
 from langbuilder.custom import Component
-from langbuilder.io import StrInput, SecretStrInput, Output
+from langbuilder.io import StrInput, SecretStrInput, DataInput, Output
 from langbuilder.schema import Data
 import httpx
-import json
+import orjson
 
 
 class HubSpotContactUpdater(Component):
@@ -24,6 +27,10 @@ class HubSpotContactUpdater(Component):
     contact records after generating assets - typically setting
     a custom property like 'last_generated_report' that triggers
     a HubSpot workflow to send an email.
+
+    When `contacts_batch` is connected, all listed contacts are updated
+    via POST /crm/v3/objects/contacts/batch/update (100 per request)
+    instead of one PATCH per contact.
     """
 
     display_name = "HubSpot Contact Updater"
@@ -31,6 +38,9 @@ class HubSpotContactUpdater(Component):
     icon = "edit"
     name = "HubSpotContactUpdater"
 
+    # HubSpot batch update limit
+    BATCH_SIZE = 100
+
     inputs = [
         SecretStrInput(
             name="hubspot_api_key",
@@ -41,15 +51,23 @@ class HubSpotContactUpdater(Component):
         StrInput(
             name="contact_id",
             display_name="Contact ID",
-            required=True,
-            info="HubSpot contact ID to update"
+            required=False,
+            info="HubSpot contact ID to update (not needed when Contacts Batch is connected)"
         ),
         StrInput(
             name="properties_json",
             display_name="Properties (JSON)",
-            required=True,
+            required=False,
             info='JSON object of properties to update. Example: {"last_generated_report": "https://..."}'
         ),
+        DataInput(
+            name="contacts_batch",
+            display_name="Contacts Batch",
+            required=False,
+            is_list=True,
+            info="Data with {contact_id, properties} items (or a contacts list of them) to update in batch",
+            advanced=True
+        ),
     ]
 
     outputs = [
@@ -67,12 +85,22 @@ class HubSpotContactUpdater(Component):
         Returns:
             Data object with success status and updated properties
         """
+        if self.contacts_batch:
+            return await self._update_batch()
+
+        if not self.contact_id:
+            self.status = "❌ No contact ID provided"
+            return Data(data={
+                "success": False,
+                "error": "Contact ID is required"
+            })
+
         # Parse properties JSON
         try:
-            properties = json.loads(self.properties_json)
+            properties = orjson.loads(self.properties_json)
             if not isinstance(properties, dict):
                 raise ValueError("Properties must be a JSON object")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.status = "❌ Invalid JSON"
             return Data(data={
                 "success": False,
@@ -93,63 +121,60 @@ class HubSpotContactUpdater(Component):
             })
 
         # Build URL
-        url = f"https://api.hubapi.com/crm/v3/objects/contacts/{self.contact_id}"
+        url = CONTACTS_URL + str(self.contact_id)
 
         # Build request payload
         payload = {
             "properties": properties
         }
 
-        headers = {
-            "Authorization": f"Bearer {self.hubspot_api_key}",
-            "Content-Type": "application/json"
-        }
+        headers = auth_headers(self.hubspot_api_key)
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.patch(url, headers=headers, json=payload)
+            client = get_client()
+            response = await client.patch(url, headers=headers, content=orjson.dumps(payload))
 
-                if response.status_code == 200:
-                    result = response.json()
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
 
-                    # Extract updated properties from response
-                    updated_props = result.get("properties", {})
+                # Extract updated properties from response
+                updated_props = result.get("properties", {})
 
-                    self.status = f"✅ Updated {len(properties)} properties"
+                self.status = f"✅ Updated {len(properties)} properties"
 
-                    return Data(data={
-                        "success": True,
-                        "contact_id": self.contact_id,
-                        "properties_updated": list(properties.keys()),
-                        "updated_values": {k: updated_props.get(k) for k in properties.keys()},
-                    })
+                return Data(data={
+                    "success": True,
+                    "contact_id": self.contact_id,
+                    "properties_updated": list(properties.keys()),
+                    "updated_values": {k: updated_props.get(k) for k in properties.keys()},
+                })
 
-                elif response.status_code == 404:
-                    self.status = "❌ Contact not found"
-                    return Data(data={
-                        "success": False,
-                        "error": f"Contact {self.contact_id} not found",
-                        "status_code": 404
-                    })
+            elif response.status_code == 404:
+                self.status = "❌ Contact not found"
+                return Data(data={
+                    "success": False,
+                    "error": f"Contact {self.contact_id} not found",
+                    "status_code": 404
+                })
 
-                elif response.status_code == 400:
-                    # Often means invalid property name
-                    error_text = response.text
-                    self.status = "❌ Invalid property"
-                    return Data(data={
-                        "success": False,
-                        "error": f"Bad request (check property names): {error_text}",
-                        "status_code": 400
-                    })
+            elif response.status_code == 400:
+                # Often means invalid property name
+                error_text = response.text
+                self.status = "❌ Invalid property"
+                return Data(data={
+                    "success": False,
+                    "error": f"Bad request (check property names): {error_text}",
+                    "status_code": 400
+                })
 
-                else:
-                    error_text = response.text
-                    self.status = f"❌ Error: {response.status_code}"
-                    return Data(data={
-                        "success": False,
-                        "error": error_text,
-                        "status_code": response.status_code
-                    })
+            else:
+                error_text = response.text
+                self.status = f"❌ Error: {response.status_code}"
+                return Data(data={
+                    "success": False,
+                    "error": error_text,
+                    "status_code": response.status_code
+                })
 
         except httpx.TimeoutException:
             self.status = "❌ Request timeout"
@@ -164,3 +189,86 @@ class HubSpotContactUpdater(Component):
                 "success": False,
                 "error": str(e)
             })
+
+    def _extract_batch(self) -> list[dict]:
+        """Collect {id, properties} update inputs from the contacts_batch Data."""
+        items = self.contacts_batch if isinstance(self.contacts_batch, list) else [self.contacts_batch]
+        entries = []
+        for item in items:
+            data = item.data if hasattr(item, "data") else item
+            if not isinstance(data, dict):
+                continue
+            entries.extend(data["contacts"] if isinstance(data.get("contacts"), list) else [data])
+
+        return [
+            {"id": str(entry.get("contact_id") or entry.get("id")), "properties": entry["properties"]}
+            for entry in entries
+            if (entry.get("contact_id") or entry.get("id")) and isinstance(entry.get("properties"), dict)
+        ]
+
+    async def _update_batch(self) -> Data:
+        """Update many contacts with the batch update endpoint, 100 per request."""
+        inputs = self._extract_batch()
+        if not inputs:
+            self.status = "❌ No contacts to update"
+            return Data(data={
+                "success": False,
+                "error": "No valid {contact_id, properties} items in Contacts Batch"
+            })
+
+        url = CONTACTS_URL + "batch/update"
+        headers = auth_headers(self.hubspot_api_key)
+        chunks = [inputs[i:i + self.BATCH_SIZE] for i in range(0, len(inputs), self.BATCH_SIZE)]
+
+        try:
+            client = get_client()
+            responses = await asyncio.gather(
+                *(client.post(url, headers=headers, content=orjson.dumps({"inputs": chunk})) for chunk in chunks)
+            )
+
+        except httpx.TimeoutException:
+            self.status = "❌ Request timeout"
+            return Data(data={
+                "success": False,
+                "error": "Request timed out after 15 seconds"
+            })
+
+        except (httpx.HTTPError, orjson.JSONEncodeError) as e:
+            self.status = f"❌ Error: {str(e)[:50]}"
+            return Data(data={
+                "success": False,
+                "error": str(e)
+            })
+
+        updated_ids = []
+        errors = []
+        for chunk, response in zip(chunks, responses, strict=True):
+            # 207 Multi-Status: some inputs failed, the rest are in results
+            if response.status_code in (200, 207):
+                try:
+                    result = orjson.loads(response.content)
+                except orjson.JSONDecodeError as e:
+                    # A success status with an unreadable body still fails only this chunk
+                    errors.append({
+                        "status_code": response.status_code,
+                        "error": f"Invalid JSON response: {e}",
+                        "contact_ids": [c["id"] for c in chunk],
+                    })
+                    continue
+                updated_ids.extend(r.get("id") for r in result.get("results", []))
+                errors.extend(result.get("errors", []))
+            else:
+                errors.append({
+                    "status_code": response.status_code,
+                    "error": response.text,
+                    "contact_ids": [c["id"] for c in chunk],
+                })
+
+        self.status = f"✅ Updated {len(updated_ids)} of {len(inputs)} contacts"
+
+        return Data(data={
+            "success": not errors,
+            "updated_count": len(updated_ids),
+            "contact_ids": updated_ids,
+            "errors": errors,
+        })
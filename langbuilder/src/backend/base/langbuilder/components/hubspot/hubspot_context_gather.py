@@ -8,12 +8,18 @@ Author: CloudGeometry
 Project: Carter's Agents - ICP Validator
 """
 
+import asyncio
+from functools import lru_cache
+
+from langbuilder.components.hubspot._cache import get_cached, get_persistent, make_key, set_cached, set_persistent
+from langbuilder.components.hubspot._client import HUBSPOT_API_URL, auth_headers, get_client
 from langbuilder.custom import Component
-from langbuilder.io import HandleInput, SecretStrInput, StrInput, Output
+from langbuilder.io import HandleInput, SecretStrInput, StrInput, BoolInput, IntInput, Output
 from langbuilder.schema import Data
 # ValueError not used - using ValueError instead
 from loguru import logger
 import httpx
+import orjson
 
 
 class HubSpotContextGatherComponent(Component):
@@ -39,6 +45,19 @@ class HubSpotContextGatherComponent(Component):
     icon = "database"
     name = "HubSpotContextGather"
 
+    # Cap on concurrent company reads when fetching all associated companies
+    MAX_CONCURRENT_COMPANY_FETCHES = 5
+
+    # HubSpot batch read limit
+    BATCH_SIZE = 100
+
+    # Properties read by _build_context; anything else requested is fetched but not returned
+    CONTACT_FIELDS = ("firstname", "lastname", "jobtitle", "email", "phone")
+    COMPANY_FIELDS = ("name", "industry", "numberofemployees", "domain", "pain_point")
+
+    # Input keys that may hold the contact ID, in priority order
+    _ID_KEYS = ("contact_id", "contactId", "id", "hs_object_id")
+
     inputs = [
         HandleInput(
             name="contact_input",
@@ -69,6 +88,31 @@ class HubSpotContextGatherComponent(Component):
             advanced=True,
             info="Comma-separated list of company properties to fetch",
         ),
+        BoolInput(
+            name="include_all_companies",
+            display_name="Include All Companies",
+            required=False,
+            value=False,
+            advanced=True,
+            info="Fetch every associated company concurrently and return them under associated_companies",
+        ),
+        IntInput(
+            name="cache_ttl",
+            display_name="Cache TTL (seconds)",
+            required=False,
+            value=60,
+            advanced=True,
+            info="Reuse a recently gathered context for the same contact for this many seconds (0 disables)",
+        ),
+        IntInput(
+            name="company_cache_ttl",
+            display_name="Company Cache TTL (seconds)",
+            required=False,
+            value=0,
+            advanced=True,
+            info="Opt-in: keep company properties for this many seconds in a cache stored on disk "
+            "(user cache directory) so it survives across runs; 0 disables",
+        ),
         StrInput(
             name="base_url",
             display_name="Base URL",
@@ -87,23 +131,30 @@ class HubSpotContextGatherComponent(Component):
         ),
     ]
 
-    def _extract_contact_id(self) -> str:
-        """Extract contact_id from the input data."""
+    def _extract_contact_ids(self) -> list[str]:
+        """Extract one or more contact IDs from the input (list input or a contact_ids list)."""
         input_data = self.contact_input
 
+        if isinstance(input_data, list):
+            return [self._extract_contact_id(item) for item in input_data]
+
+        data = getattr(input_data, "data", None)
+        if isinstance(data, dict) and isinstance(data.get("contact_ids"), list):
+            return [str(cid) for cid in data["contact_ids"] if cid]
+
+        return [self._extract_contact_id(input_data)]
+
+    def _extract_contact_id(self, input_data) -> str:
+        """Extract contact_id from the input data."""
         # Handle Data object
-        if hasattr(input_data, "data"):
-            data = input_data.data
-            if isinstance(data, dict):
-                # Try different possible keys
-                for key in ["contact_id", "contactId", "id", "hs_object_id"]:
-                    if key in data:
-                        return str(data[key])
-                # Check nested properties
-                if "properties" in data:
-                    props = data["properties"]
-                    if "hs_object_id" in props:
-                        return str(props["hs_object_id"])
+        data = getattr(input_data, "data", None)
+        if isinstance(data, dict):
+            contact_id = next((data[key] for key in self._ID_KEYS if key in data), None)
+            # Fall back to nested properties
+            if contact_id is None:
+                contact_id = (data.get("properties") or {}).get("hs_object_id")
+            if contact_id is not None:
+                return str(contact_id)
 
         # Handle string (direct contact_id)
         if isinstance(input_data, str):
@@ -128,102 +179,113 @@ class HubSpotContextGatherComponent(Component):
             - company: Associated company properties dict
             - contact_id: Original contact ID
             - company_id: Associated company ID (if found)
+
+            When the input carries several contact IDs, the contexts are
+            gathered with batch reads and returned as a `contacts` list
+            of the dicts above, plus `count` and `contact_ids`.
         """
         if not self.hubspot_api_key:
             raise ValueError("HubSpot API key is required")
 
-        contact_id = self._extract_contact_id()
-        if not contact_id:
+        contact_ids = list(dict.fromkeys(self._extract_contact_ids()))
+        if not contact_ids or not all(contact_ids):
             raise ValueError("contact_id is required")
 
-        base_url = self.base_url or "https://api.hubapi.com"
+        base_url = self.base_url or HUBSPOT_API_URL
 
-        headers = {
-            "Authorization": f"Bearer {self.hubspot_api_key}",
-            "Content-Type": "application/json",
-        }
+        headers = auth_headers(self.hubspot_api_key)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Step 1: Fetch contact with associations
-                contact_props = self.contact_properties or "firstname,lastname,jobtitle,email"
-                contact_url = (
-                    f"{base_url}/crm/v3/objects/contacts/{contact_id}"
-                    f"?properties={contact_props}"
-                    f"&associations=companies"
-                )
-
-                contact_response = await client.get(contact_url, headers=headers)
-
-                if contact_response.status_code == 404:
-                    self.status = "Contact not found"
-                    raise ValueError(f"Contact {contact_id} not found in HubSpot")
+            client = get_client()
+
+            # Several contacts: use the batch read endpoints
+            if len(contact_ids) > 1:
+                return await self._gather_batch(client, base_url, headers, contact_ids)
+
+            contact_id = contact_ids[0]
+
+            # Serve repeat gathers for the same contact from the short-lived cache
+            cache_key = self._context_cache_key(contact_id, base_url)
+            if self.cache_ttl:
+                cached = get_cached(cache_key)
+                if cached is not None:
+                    self.status = f"Gathered (cached): {contact_id}"
+                    return Data(data=cached)
+
+            # Step 1: Fetch contact with associations
+            contact_props = ",".join(self._contact_property_list())
+            contact_url = (
+                f"{base_url}/crm/v3/objects/contacts/{contact_id}"
+                f"?properties={contact_props}"
+                f"&associations=companies"
+            )
 
-                if contact_response.status_code != 200:
-                    self._handle_error(contact_response, "Contact fetch")
+            contact_response = await client.get(contact_url, headers=headers, timeout=30.0)
+
+            if contact_response.status_code == 404:
+                self.status = "Contact not found"
+                raise ValueError(f"Contact {contact_id} not found in HubSpot")
+
+            if contact_response.status_code != 200:
+                self._handle_error(contact_response, "Contact fetch")
+
+            contact_data = orjson.loads(contact_response.content)
+            contact_props_dict = contact_data.get("properties", {})
+
+            # Step 2: Get associated company IDs (the first one is the primary company)
+            associations = contact_data.get("associations", {})
+            companies = associations.get("companies", {}).get("results", [])
+            company_ids = [c.get("id") for c in companies if c.get("id")]
+            company_id = company_ids[0] if company_ids else None
+
+            # Step 3: Fetch company data if associated
+            company_props_dict = {}
+            associated_companies = []
+            if company_id:
+                company_props = ",".join(self._company_property_list())
+                fetch_ids = company_ids if self.include_all_companies else [company_id]
+                semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_COMPANY_FETCHES)
+
+                fetched = await asyncio.gather(
+                    *(
+                        self._fetch_company(client, base_url, headers, cid, company_props, semaphore)
+                        for cid in fetch_ids
+                    ),
+                    return_exceptions=True,
+                )
 
-                contact_data = contact_response.json()
-                contact_props_dict = contact_data.get("properties", {})
+                # The primary company fails the gather as before; other companies are best effort
+                if isinstance(fetched[0], BaseException):
+                    raise fetched[0]
+                company_props_dict = fetched[0]
 
-                # Step 2: Get associated company ID
-                company_id = None
-                associations = contact_data.get("associations", {})
-                companies = associations.get("companies", {}).get("results", [])
+                for cid, outcome in zip(fetch_ids, fetched, strict=True):
+                    if isinstance(outcome, BaseException):
+                        logger.warning(f"Could not fetch company {cid}: {outcome}")
+                        company_fields = {}
+                    else:
+                        company_fields = outcome
+                    associated_companies.append({"id": cid, **company_fields})
 
-                if companies:
-                    # Get first associated company
-                    company_id = companies[0].get("id")
+            # Build result
+            result = self._build_context(contact_id, contact_props_dict, company_id, company_props_dict)
+            if self.include_all_companies:
+                result["associated_companies"] = associated_companies
 
-                # Step 3: Fetch company data if associated
-                company_props_dict = {}
-                if company_id:
-                    company_props = self.company_properties or "name,industry,numberofemployees"
-                    company_url = (
-                        f"{base_url}/crm/v3/objects/companies/{company_id}"
-                        f"?properties={company_props}"
-                    )
+            if self.cache_ttl:
+                set_cached(cache_key, result, self.cache_ttl)
 
-                    company_response = await client.get(company_url, headers=headers)
+            # Set status for UI
+            contact_name = f"{result['contact']['firstname']} {result['contact']['lastname']}".strip()
+            company_name = result["company"]["name"] or "No company"
+            self.status = f"Gathered: {contact_name} @ {company_name}"
 
-                    if company_response.status_code == 200:
-                        company_data = company_response.json()
-                        company_props_dict = company_data.get("properties", {})
-                    else:
-                        logger.warning(f"Could not fetch company {company_id}: {company_response.status_code}")
-
-                # Build result
-                result = {
-                    "contact_id": contact_id,
-                    "company_id": company_id,
-                    "contact": {
-                        "id": contact_id,
-                        "firstname": contact_props_dict.get("firstname", ""),
-                        "lastname": contact_props_dict.get("lastname", ""),
-                        "jobtitle": contact_props_dict.get("jobtitle", ""),
-                        "email": contact_props_dict.get("email", ""),
-                        "phone": contact_props_dict.get("phone", ""),
-                    },
-                    "company": {
-                        "id": company_id,
-                        "name": company_props_dict.get("name", ""),
-                        "industry": company_props_dict.get("industry", ""),
-                        "numberofemployees": company_props_dict.get("numberofemployees", ""),
-                        "domain": company_props_dict.get("domain", ""),
-                        "pain_point": company_props_dict.get("pain_point", ""),
-                    },
-                }
-
-                # Set status for UI
-                contact_name = f"{result['contact']['firstname']} {result['contact']['lastname']}".strip()
-                company_name = result["company"]["name"] or "No company"
-                self.status = f"Gathered: {contact_name} @ {company_name}"
-
-                logger.info(
-                    f"HubSpot context gathered for contact {contact_id}: "
-                    f"{contact_name}, {result['contact']['jobtitle']} at {company_name}"
-                )
+            logger.info(
+                f"HubSpot context gathered for contact {contact_id}: "
+                f"{contact_name}, {result['contact']['jobtitle']} at {company_name}"
+            )
 
-                return Data(data=result)
+            return Data(data=result)
 
         except ValueError:
             raise
@@ -232,6 +294,255 @@ class HubSpotContextGatherComponent(Component):
             self.status = f"Error: {str(e)}"
             raise ValueError(f"HubSpot context gather failed: {str(e)}") from e
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _select_properties(
+        requested: str | None, fallback: str, used: tuple[str, ...]
+    ) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Properties to request, and those of them the context drops.
+
+        User-requested properties are always sent; the built-in fallback is
+        trimmed to used. The property inputs are configuration, so the parse
+        is cached per input string; callers warn about the dropped names.
+        """
+        names = tuple(dict.fromkeys(p.strip() for p in (requested or "").split(",") if p.strip()))
+        if not names:
+            return tuple(p for p in fallback.split(",") if p in used), ()
+        return names, tuple(p for p in names if p not in used)
+
+    def _property_list(self, requested: str | None, fallback: str, used: tuple[str, ...]) -> tuple[str, ...]:
+        """Select the properties to request, warning about any left out of the gathered context."""
+        names, dropped = self._select_properties(requested, fallback, used)
+        if dropped:
+            logger.warning(f"HubSpot properties not included in the gathered context: {', '.join(dropped)}")
+        return names
+
+    def _contact_property_list(self) -> tuple[str, ...]:
+        """Contact properties to request from HubSpot."""
+        return self._property_list(self.contact_properties, "firstname,lastname,jobtitle,email", self.CONTACT_FIELDS)
+
+    def _company_property_list(self) -> tuple[str, ...]:
+        """Company properties to request from HubSpot."""
+        return self._property_list(self.company_properties, "name,industry,numberofemployees", self.COMPANY_FIELDS)
+
+    def _context_cache_key(self, contact_id: str, base_url: str) -> tuple:
+        """Key for one contact's gathered context in the short-lived cache."""
+        return make_key(
+            self.hubspot_api_key,
+            "context",
+            contact_id,
+            base_url,
+            self.contact_properties,
+            self.company_properties,
+            bool(self.include_all_companies),
+        )
+
+    def _company_cache_key(self, company_id: str, base_url: str, company_props: str) -> tuple:
+        """Key for one company's properties in the on-disk cache."""
+        return make_key(self.hubspot_api_key, "company", company_id, base_url, company_props)
+
+    @staticmethod
+    def _build_context(contact_id: str, contact_props: dict, company_id: str | None, company_props: dict) -> dict:
+        """Build the context dict for one contact and its primary company."""
+        return {
+            "contact_id": contact_id,
+            "company_id": company_id,
+            "contact": {
+                "id": contact_id,
+                "firstname": contact_props.get("firstname", ""),
+                "lastname": contact_props.get("lastname", ""),
+                "jobtitle": contact_props.get("jobtitle", ""),
+                "email": contact_props.get("email", ""),
+                "phone": contact_props.get("phone", ""),
+            },
+            "company": {
+                "id": company_id,
+                "name": company_props.get("name", ""),
+                "industry": company_props.get("industry", ""),
+                "numberofemployees": company_props.get("numberofemployees", ""),
+                "domain": company_props.get("domain", ""),
+                "pain_point": company_props.get("pain_point", ""),
+            },
+        }
+
+    async def _batch_read(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: dict,
+        ids: list[str],
+        properties: tuple[str, ...] | None = None,
+    ) -> list[dict]:
+        """POST ids to a HubSpot batch read endpoint in chunks of BATCH_SIZE and return all results."""
+        chunks = [ids[i:i + self.BATCH_SIZE] for i in range(0, len(ids), self.BATCH_SIZE)]
+        payloads = [{"inputs": [{"id": i} for i in chunk]} for chunk in chunks]
+        if properties is not None:
+            for payload in payloads:
+                payload["properties"] = properties
+
+        responses = await asyncio.gather(
+            *(client.post(url, headers=headers, content=orjson.dumps(payload), timeout=30.0) for payload in payloads)
+        )
+
+        results = []
+        for response in responses:
+            # 207 Multi-Status: some IDs were not found, the rest are in results
+            if response.status_code not in (200, 207):
+                self._handle_error(response, "Batch read")
+            results.extend(orjson.loads(response.content).get("results", []))
+        return results
+
+    async def _gather_batch(
+        self, client: httpx.AsyncClient, base_url: str, headers: dict, contact_ids: list[str]
+    ) -> Data:
+        """Gather context for several contacts with batch reads (contacts, associations, companies)."""
+        # Contexts gathered recently (by either path) are served from the short-lived cache
+        cached_contexts = {}
+        if self.cache_ttl:
+            for contact_id in contact_ids:
+                cached = get_cached(self._context_cache_key(contact_id, base_url))
+                if cached is not None:
+                    cached_contexts[contact_id] = cached
+        fetch_ids = [cid for cid in contact_ids if cid not in cached_contexts]
+
+        contact_props_by_id = {}
+        associated_ids = {}
+        company_props_by_id = {}
+        if fetch_ids:
+            # Contacts and their company associations are independent, so read both at once
+            contact_results, association_results = await asyncio.gather(
+                self._batch_read(
+                    client,
+                    f"{base_url}/crm/v3/objects/contacts/batch/read",
+                    headers,
+                    fetch_ids,
+                    self._contact_property_list(),
+                ),
+                self._batch_read(
+                    client, f"{base_url}/crm/v3/associations/contacts/companies/batch/read", headers, fetch_ids
+                ),
+            )
+
+            contact_props_by_id = {r.get("id"): r.get("properties", {}) for r in contact_results}
+            # The first associated company is the primary one
+            associated_ids = {
+                r["from"]["id"]: [to["id"] for to in r["to"]]
+                for r in association_results
+                if r.get("to") and r.get("from")
+            }
+
+            if self.include_all_companies:
+                company_ids = [cid for ids in associated_ids.values() for cid in ids]
+            else:
+                company_ids = [ids[0] for ids in associated_ids.values()]
+            company_props_by_id = await self._batch_read_companies(
+                client, base_url, headers, list(dict.fromkeys(company_ids))
+            )
+
+        contexts = []
+        for contact_id in contact_ids:
+            if contact_id in cached_contexts:
+                contexts.append(cached_contexts[contact_id])
+                continue
+            if contact_id not in contact_props_by_id:
+                logger.warning(f"Contact {contact_id} not found in HubSpot")
+                continue
+            company_ids = associated_ids.get(contact_id, [])
+            company_id = company_ids[0] if company_ids else None
+            context = self._build_context(
+                contact_id,
+                contact_props_by_id[contact_id],
+                company_id,
+                company_props_by_id.get(company_id, {}),
+            )
+            if self.include_all_companies:
+                context["associated_companies"] = [
+                    {"id": cid, **company_props_by_id.get(cid, {})} for cid in company_ids
+                ]
+            if self.cache_ttl:
+                set_cached(self._context_cache_key(contact_id, base_url), context, self.cache_ttl)
+            contexts.append(context)
+
+        self.status = f"Gathered {len(contexts)} of {len(contact_ids)} contacts"
+        logger.info(f"HubSpot context gathered for {len(contexts)} of {len(contact_ids)} contacts")
+
+        return Data(
+            data={
+                "contacts": contexts,
+                "count": len(contexts),
+                "contact_ids": contact_ids,
+            }
+        )
+
+    async def _batch_read_companies(
+        self, client: httpx.AsyncClient, base_url: str, headers: dict, company_ids: list[str]
+    ) -> dict[str, dict]:
+        """Properties of each company by id, from the on-disk cache (when enabled) or one batch read."""
+        properties = self._company_property_list()
+        company_props = ",".join(properties)
+        props_by_id = {}
+        if self.company_cache_ttl:
+            for company_id in company_ids:
+                cached = await asyncio.to_thread(
+                    get_persistent, self._company_cache_key(company_id, base_url, company_props)
+                )
+                if cached is not None:
+                    props_by_id[company_id] = cached
+
+        missing = [cid for cid in company_ids if cid not in props_by_id]
+        if not missing:
+            return props_by_id
+
+        company_results = await self._batch_read(
+            client, f"{base_url}/crm/v3/objects/companies/batch/read", headers, missing, properties
+        )
+        for r in company_results:
+            company_id, props = r.get("id"), r.get("properties", {})
+            props_by_id[company_id] = props
+            if self.company_cache_ttl:
+                await asyncio.to_thread(
+                    set_persistent,
+                    self._company_cache_key(company_id, base_url, company_props),
+                    props,
+                    self.company_cache_ttl,
+                )
+        return props_by_id
+
+    async def _fetch_company(
+        self,
+        client: httpx.AsyncClient,
+        base_url: str,
+        headers: dict,
+        company_id: str,
+        company_props: str,
+        semaphore: asyncio.Semaphore,
+    ) -> dict:
+        """Fetch one company's properties, or an empty dict if HubSpot returns an error."""
+        # Company properties change rarely, so they are also cached on disk across runs
+        cache_key = self._company_cache_key(company_id, base_url, company_props)
+        if self.company_cache_ttl:
+            cached = await asyncio.to_thread(get_persistent, cache_key)
+            if cached is not None:
+                return cached
+
+        company_url = (
+            f"{base_url}/crm/v3/objects/companies/{company_id}"
+            f"?properties={company_props}"
+        )
+
+        async with semaphore:
+            company_response = await client.get(company_url, headers=headers, timeout=30.0)
+
+        if company_response.status_code == 200:
+            company_data = orjson.loads(company_response.content)
+            props = company_data.get("properties", {})
+            if self.company_cache_ttl:
+                await asyncio.to_thread(set_persistent, cache_key, props, self.company_cache_ttl)
+            return props
+
+        logger.warning(f"Could not fetch company {company_id}: {company_response.status_code}")
+        return {}
+
     def _handle_error(self, response: httpx.Response, operation: str):
         """Handle API error response."""
         if response.status_code == 401:
@@ -245,7 +556,7 @@ class HubSpotContextGatherComponent(Component):
             )
         else:
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 error_msg = error_data.get("message", response.text)
             except Exception:
                 error_msg = response.text
@@ -8,12 +8,26 @@ Author: CloudGeometry
 Project: Carter's Agents - Email Copywriter
 """
 
+import asyncio
+
+from langbuilder.components.hubspot._client import HUBSPOT_API_URL, auth_headers, get_client
 from langbuilder.custom import Component
-from langbuilder.io import HandleInput, StrInput, SecretStrInput, Output
+from langbuilder.io import DataInput, HandleInput, StrInput, SecretStrInput, Output
 from langbuilder.schema import Data
 import httpx
+import orjson
 import time
 
+_NOTES_URL = f"{HUBSPOT_API_URL}/crm/v3/objects/notes"
+_BATCH_CREATE_URL = _NOTES_URL + "/batch/create"
+# Shared by every payload; not mutated
+_NOTE_TO_CONTACT_TYPES = (
+    {
+        "associationCategory": "HUBSPOT_DEFINED",
+        "associationTypeId": 202  # Note to Contact
+    },
+)
+
 
 class HubSpotNoteCreator(Component):
     """
@@ -21,6 +35,10 @@ class HubSpotNoteCreator(Component):
 
     This component is used by the Email Copywriter agent to save generated
     email drafts to HubSpot so sales reps can review and send them.
+
+    When `notes_batch` is connected, one note per listed contact is created
+    via POST /crm/v3/objects/notes/batch/create (100 per request, sent
+    concurrently) instead of one request per note.
     """
 
     display_name = "HubSpot Note Creator"
@@ -28,6 +46,9 @@ class HubSpotNoteCreator(Component):
     icon = "mail"
     name = "HubSpotNoteCreator"
 
+    # HubSpot batch create limit
+    BATCH_SIZE = 100
+
     inputs = [
         SecretStrInput(
             name="hubspot_api_key",
@@ -39,21 +60,21 @@ class HubSpotNoteCreator(Component):
             name="contact_id",
             display_name="Contact ID",
             input_types=["Data", "Message"],
-            required=True,
-            info="HubSpot contact ID to associate the note with (accepts Data with contact_id field)"
+            required=False,
+            info="HubSpot contact ID to associate the note with (Data with contact_id; not needed for Notes Batch)"
         ),
         HandleInput(
             name="subject_line",
             display_name="Subject Line",
             input_types=["Data", "Message"],
-            required=True,
+            required=False,
             info="Email draft subject line"
         ),
         HandleInput(
             name="email_body",
             display_name="Email Body",
             input_types=["Data", "Message"],
-            required=True,
+            required=False,
             info="Email draft body content (e.g., LLM reasoning)"
         ),
         StrInput(
@@ -63,6 +84,14 @@ class HubSpotNoteCreator(Component):
             advanced=True,
             info="Case study or source referenced in the email"
         ),
+        DataInput(
+            name="notes_batch",
+            display_name="Notes Batch",
+            required=False,
+            is_list=True,
+            info="Data with {contact_id, subject_line, email_body} items (or a notes list of them) to create in batch",
+            advanced=True
+        ),
     ]
 
     outputs = [
@@ -102,21 +131,8 @@ class HubSpotNoteCreator(Component):
         # Handle string
         return str(input_data)
 
-    async def create_note(self) -> Data:
-        """
-        Create a NOTE engagement in HubSpot with the email draft.
-
-        Returns:
-            Data object with success status, engagement ID, and HubSpot URL
-        """
-        url = "https://api.hubapi.com/crm/v3/objects/notes"
-
-        # Extract values from potentially Data inputs
-        contact_id = self._extract_value(self.contact_id, "contact_id")
-        subject_line = self._extract_value(self.subject_line, "subject_line") or "ICP Validation Result"
-        email_body = self._extract_value(self.email_body, "reasoning") or self._extract_value(self.email_body, "email_body")
-
-        # Build note body with clear formatting
+    def _format_note_body(self, subject_line: str, email_body: str) -> str:
+        """Format the email draft as a note body, with the source citation if provided."""
         note_body = f"""🤖 AI-GENERATED EMAIL DRAFT
 
 SUBJECT: {subject_line}
@@ -128,59 +144,79 @@ BODY:
         # Add source citation if provided
         if self.source_cited:
             note_body += f"\n---\nSource: {self.source_cited}"
+        return note_body
 
-        # Build request payload with association
-        payload = {
+    @staticmethod
+    def _note_payload(contact_id: str, note_body: str, timestamp: str) -> dict:
+        """Build the note create input, associated with the contact."""
+        return {
             "properties": {
                 "hs_note_body": note_body,
-                "hs_timestamp": str(int(time.time() * 1000))
+                "hs_timestamp": timestamp
             },
             "associations": [
                 {
                     "to": {"id": contact_id},
-                    "types": [
-                        {
-                            "associationCategory": "HUBSPOT_DEFINED",
-                            "associationTypeId": 202  # Note to Contact
-                        }
-                    ]
+                    "types": _NOTE_TO_CONTACT_TYPES
                 }
             ]
         }
 
-        headers = {
-            "Authorization": f"Bearer {self.hubspot_api_key}",
-            "Content-Type": "application/json"
-        }
+    async def create_note(self) -> Data:
+        """
+        Create a NOTE engagement in HubSpot with the email draft.
+
+        Returns:
+            Data object with success status, engagement ID, and HubSpot URL
+        """
+        if self.notes_batch:
+            return await self._create_batch()
+
+        # Extract values from potentially Data inputs
+        contact_id = self._extract_value(self.contact_id, "contact_id")
+        subject_line = self._extract_value(self.subject_line, "subject_line") or "ICP Validation Result"
+        email_body = self._extract_value(self.email_body, "reasoning") or self._extract_value(self.email_body, "email_body")
+
+        if not contact_id:
+            self.status = "❌ No contact ID provided"
+            return Data(data={
+                "success": False,
+                "error": "Contact ID is required"
+            })
+
+        note_body = self._format_note_body(subject_line, email_body)
+        payload = self._note_payload(contact_id, note_body, str(int(time.time() * 1000)))
+
+        headers = auth_headers(self.hubspot_api_key)
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.post(url, headers=headers, json=payload)
+            client = get_client()
+            response = await client.post(_NOTES_URL, headers=headers, content=orjson.dumps(payload))
 
-                if response.status_code in [200, 201]:
-                    result = response.json()
-                    engagement_id = result.get("id")
+            if response.status_code in [200, 201]:
+                result = orjson.loads(response.content)
+                engagement_id = result.get("id")
 
-                    # Build HubSpot contact URL
-                    hubspot_url = f"https://app.hubspot.com/contacts/contacts/{contact_id}"
+                # Build HubSpot contact URL
+                hubspot_url = f"https://app.hubspot.com/contacts/contacts/{contact_id}"
 
-                    self.status = f"✅ Note created: {engagement_id}"
+                self.status = f"✅ Note created: {engagement_id}"
 
-                    return Data(data={
-                        "success": True,
-                        "engagement_id": engagement_id,
-                        "hubspot_url": hubspot_url,
-                        "note_body_preview": note_body[:200] + "..." if len(note_body) > 200 else note_body
-                    })
-                else:
-                    error_text = response.text
-                    self.status = f"❌ Error: {response.status_code}"
-
-                    return Data(data={
-                        "success": False,
-                        "error": error_text,
-                        "status_code": response.status_code
-                    })
+                return Data(data={
+                    "success": True,
+                    "engagement_id": engagement_id,
+                    "hubspot_url": hubspot_url,
+                    "note_body_preview": note_body[:200] + "..." if len(note_body) > 200 else note_body
+                })
+            else:
+                error_text = response.text
+                self.status = f"❌ Error: {response.status_code}"
+
+                return Data(data={
+                    "success": False,
+                    "error": error_text,
+                    "status_code": response.status_code
+                })
 
         except httpx.TimeoutException:
             self.status = "❌ Request timeout"
@@ -194,3 +230,96 @@ BODY:
                 "success": False,
                 "error": str(e)
             })
+
+    def _extract_batch(self) -> list[dict]:
+        """Collect note create inputs from the notes_batch Data."""
+        items = self.notes_batch if isinstance(self.notes_batch, list) else [self.notes_batch]
+        entries = []
+        for item in items:
+            data = item.data if hasattr(item, "data") else item
+            if not isinstance(data, dict):
+                continue
+            entries.extend(data["notes"] if isinstance(data.get("notes"), list) else [data])
+
+        timestamp = str(int(time.time() * 1000))
+        return [
+            self._note_payload(
+                str(entry.get("contact_id") or entry.get("id")),
+                self._format_note_body(
+                    entry.get("subject_line") or "ICP Validation Result",
+                    entry.get("email_body") or entry.get("reasoning") or "",
+                ),
+                timestamp,
+            )
+            for entry in entries
+            if isinstance(entry, dict) and (entry.get("contact_id") or entry.get("id"))
+        ]
+
+    async def _create_batch(self) -> Data:
+        """Create many notes with the batch create endpoint, 100 per request."""
+        inputs = self._extract_batch()
+        if not inputs:
+            self.status = "❌ No notes to create"
+            return Data(data={
+                "success": False,
+                "error": "No valid {contact_id, subject_line, email_body} items in Notes Batch"
+            })
+
+        headers = auth_headers(self.hubspot_api_key)
+        chunks = [inputs[i:i + self.BATCH_SIZE] for i in range(0, len(inputs), self.BATCH_SIZE)]
+
+        try:
+            client = get_client()
+            responses = await asyncio.gather(
+                *(
+                    client.post(_BATCH_CREATE_URL, headers=headers, content=orjson.dumps({"inputs": chunk}))
+                    for chunk in chunks
+                )
+            )
+
+        except httpx.TimeoutException:
+            self.status = "❌ Request timeout"
+            return Data(data={
+                "success": False,
+                "error": "Request timed out after 15 seconds"
+            })
+
+        except (httpx.HTTPError, orjson.JSONEncodeError) as e:
+            self.status = f"❌ Error: {e!s}"
+            return Data(data={
+                "success": False,
+                "error": str(e)
+            })
+
+        engagement_ids = []
+        errors = []
+        for chunk, response in zip(chunks, responses, strict=True):
+            # 207 Multi-Status: some inputs failed, the rest are in results
+            if response.status_code in (200, 201, 207):
+                try:
+                    result = orjson.loads(response.content)
+                except orjson.JSONDecodeError as e:
+                    # A success status with an unreadable body still fails only this chunk
+                    errors.append({
+                        "status_code": response.status_code,
+                        "error": f"Invalid JSON response: {e}",
+                        "contact_ids": [note["associations"][0]["to"]["id"] for note in chunk],
+                    })
+                    continue
+                engagement_ids.extend(r.get("id") for r in result.get("results", []))
+                errors.extend(result.get("errors", []))
+            else:
+                errors.append({
+                    "status_code": response.status_code,
+                    "error": response.text,
+                    "contact_ids": [note["associations"][0]["to"]["id"] for note in chunk],
+                })
+
+        self.status = f"✅ Created {len(engagement_ids)} of {len(inputs)} notes"
+
+        return Data(data={
+            "success": not errors,
+            "created_count": len(engagement_ids),
+            "engagement_ids": engagement_ids,
+            "errors": errors,
+        })
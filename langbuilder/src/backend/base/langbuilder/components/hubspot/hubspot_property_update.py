@@ -8,13 +8,13 @@ Author: CloudGeometry
 Project: Carter's Agents - ICP Validator
 """
 
+from langbuilder.components.hubspot._client import HUBSPOT_API_URL, auth_headers, get_client
 from langbuilder.custom import Component
 from langbuilder.io import HandleInput, SecretStrInput, StrInput, Output
 from langbuilder.schema import Data
 # ValueError not used
 from loguru import logger
-import httpx
-import json
+import orjson
 
 
 class HubSpotPropertyUpdateComponent(Component):
@@ -33,6 +33,10 @@ class HubSpotPropertyUpdateComponent(Component):
     icon = "edit"
     name = "HubSpotPropertyUpdate"
 
+    # Keys that may hold the contact ID, at the top level and in a nested contact object
+    _ID_KEYS = ("contact_id", "contactId", "id", "hs_object_id")
+    _NESTED_ID_KEYS = ("id", "contact_id", "hs_object_id")
+
     inputs = [
         HandleInput(
             name="contact_input",
@@ -65,7 +69,7 @@ class HubSpotPropertyUpdateComponent(Component):
             name="base_url",
             display_name="Base URL",
             required=False,
-            value="https://api.hubapi.com",
+            value=HUBSPOT_API_URL,
             advanced=True,
             info="HubSpot API base URL",
         ),
@@ -88,13 +92,13 @@ class HubSpotPropertyUpdateComponent(Component):
             data = input_data.data
             if isinstance(data, dict):
                 # Try different possible keys
-                for key in ["contact_id", "contactId", "id", "hs_object_id"]:
+                for key in self._ID_KEYS:
                     if key in data:
                         return str(data[key])
                 # Check nested contact object
                 if "contact" in data and isinstance(data["contact"], dict):
                     contact = data["contact"]
-                    for key in ["id", "contact_id", "hs_object_id"]:
+                    for key in self._NESTED_ID_KEYS:
                         if key in contact:
                             return str(contact[key])
 
@@ -125,8 +129,8 @@ class HubSpotPropertyUpdateComponent(Component):
         # Fall back to static_properties
         if self.static_properties:
             try:
-                return json.loads(self.static_properties)
-            except json.JSONDecodeError as e:
+                return orjson.loads(self.static_properties)
+            except orjson.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON in static_properties: {e}")
 
         raise ValueError("No properties to update - provide properties_input or static_properties")
@@ -151,65 +155,62 @@ class HubSpotPropertyUpdateComponent(Component):
         if not properties:
             raise ValueError("No properties provided to update")
 
-        base_url = self.base_url or "https://api.hubapi.com"
+        base_url = self.base_url or HUBSPOT_API_URL
         url = f"{base_url}/crm/v3/objects/contacts/{contact_id}"
 
-        headers = {
-            "Authorization": f"Bearer {self.hubspot_api_key}",
-            "Content-Type": "application/json",
-        }
+        headers = auth_headers(self.hubspot_api_key)
 
         payload = {"properties": properties}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.patch(url, headers=headers, json=payload)
-
-                if response.status_code == 200:
-                    result = response.json()
-
-                    # Build HubSpot URL
-                    hubspot_url = f"https://app.hubspot.com/contacts/contacts/{contact_id}"
-
-                    props_list = list(properties.keys())
-                    self.status = f"Updated: {', '.join(props_list)}"
-
-                    logger.info(f"HubSpot contact {contact_id} updated with properties: {props_list}")
-
-                    return Data(
-                        data={
-                            "success": True,
-                            "contact_id": contact_id,
-                            "properties_updated": props_list,
-                            "hubspot_url": hubspot_url,
-                        }
-                    )
-
-                elif response.status_code == 404:
-                    self.status = "Contact not found"
-                    raise ValueError(f"Contact {contact_id} not found in HubSpot")
-
-                elif response.status_code == 401:
-                    self.status = "Authentication failed"
-                    raise ValueError("HubSpot authentication failed - check API key")
-
-                elif response.status_code == 403:
-                    self.status = "Permission denied"
-                    raise ValueError(
-                        "HubSpot permission denied - ensure crm.objects.contacts.write scope"
-                    )
-
-                else:
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get("message", response.text)
-                    except Exception:
-                        error_msg = response.text
-
-                    self.status = f"Error: {response.status_code}"
-                    raise ValueError(
-                        f"HubSpot property update failed ({response.status_code}): {error_msg}"
-                    )
+            client = get_client()
+            response = await client.patch(url, headers=headers, content=orjson.dumps(payload), timeout=30.0)
+
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+
+                # Build HubSpot URL
+                hubspot_url = f"https://app.hubspot.com/contacts/contacts/{contact_id}"
+
+                props_list = list(properties.keys())
+                self.status = f"Updated: {', '.join(props_list)}"
+
+                logger.info(f"HubSpot contact {contact_id} updated with properties: {props_list}")
+
+                return Data(
+                    data={
+                        "success": True,
+                        "contact_id": contact_id,
+                        "properties_updated": props_list,
+                        "hubspot_url": hubspot_url,
+                    }
+                )
+
+            elif response.status_code == 404:
+                self.status = "Contact not found"
+                raise ValueError(f"Contact {contact_id} not found in HubSpot")
+
+            elif response.status_code == 401:
+                self.status = "Authentication failed"
+                raise ValueError("HubSpot authentication failed - check API key")
+
+            elif response.status_code == 403:
+                self.status = "Permission denied"
+                raise ValueError(
+                    "HubSpot permission denied - ensure crm.objects.contacts.write scope"
+                )
+
+            else:
+                try:
+                    error_data = orjson.loads(response.content)
+                    error_msg = error_data.get("message", response.text)
+                except Exception:
+                    error_msg = response.text
+
+                self.status = f"Error: {response.status_code}"
+                raise ValueError(
+                    f"HubSpot property update failed ({response.status_code}): {error_msg}"
+                )
 
         except ValueError:
             raise
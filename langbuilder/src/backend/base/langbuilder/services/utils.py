@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from typing import TYPE_CHECKING
 
 from loguru import logger
@@ -131,6 +132,11 @@ async def teardown_services() -> None:
 
     await service_manager.teardown()
 
+    # Close the pooled HubSpot client if a HubSpot component loaded it
+    hubspot_client = sys.modules.get("langbuilder.components.hubspot._client")
+    if hubspot_client is not None:
+        await hubspot_client.aclose_client()
+
 
 def initialize_settings_service() -> None:
     """Initialize the settings manager."""
@@ -0,0 +1,150 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from composio import Action
+from langbuilder.components.composio.jira_composio import ComposioJiraAPIComponent
+
+from tests.base import DID_NOT_EXIST, ComponentTestBaseWithoutClient
+
+from .test_base import MockComposioToolSet
+
+
+def make_paged_toolset(items: list[dict], items_key: str = "values", limit_param: str = "max_results"):
+    """Toolset whose execute_action serves `items` in pages, honouring the start_at offset."""
+
+    def execute_action(*, action, params):  # noqa: ARG001
+        start = params.get("start_at", 0)
+        page = items[start : start + params[limit_param]]
+        return {"successful": True, "data": {"details": {"total": len(items), items_key: page}}}
+
+    toolset = MagicMock()
+    toolset.execute_action.side_effect = execute_action
+    return toolset
+
+
+class TestJiraComponent(ComponentTestBaseWithoutClient):
+    @pytest.fixture(autouse=True)
+    def mock_composio_toolset(self):
+        with patch("langbuilder.base.composio.composio_base.ComposioToolSet", MockComposioToolSet):
+            yield
+
+    @pytest.fixture
+    def component_class(self):
+        return ComposioJiraAPIComponent
+
+    @pytest.fixture
+    def default_kwargs(self):
+        return {
+            "api_key": "",
+            "entity_id": "default",
+            "action": None,
+        }
+
+    @pytest.fixture
+    def file_names_mapping(self):
+        # Component not yet released, mark all versions as non-existent
+        return [
+            {"version": "1.0.17", "module": "composio", "file_name": DID_NOT_EXIST},
+            {"version": "1.0.18", "module": "composio", "file_name": DID_NOT_EXIST},
+            {"version": "1.0.19", "module": "composio", "file_name": DID_NOT_EXIST},
+            {"version": "1.1.0", "module": "composio", "file_name": DID_NOT_EXIST},
+            {"version": "1.1.1", "module": "composio", "file_name": DID_NOT_EXIST},
+        ]
+
+    def test_only_actions_with_declared_offset_are_paged(self, component_class):
+        assert "JIRA_SEARCH_ISSUES" not in component_class._paged_actions
+        assert component_class._paged_actions["JIRA_FIND_USERS"] == ("max_results", "start_at")
+        assert component_class._paged_actions["JIRA_LIST_SPRINTS"] == ("max_results", "start_at")
+
+    def test_execute_paged_sends_offsets_and_merges_without_duplicates(self, component_class, default_kwargs):
+        component = component_class(**default_kwargs)
+        users = [{"accountId": str(i)} for i in range(250)]
+        toolset = make_paged_toolset(users)
+
+        result = component._execute_paged(
+            toolset, "JIRA_FIND_USERS", "JIRA_FIND_USERS", {"max_results": 250, "start_at": 0}
+        )
+
+        # First call is the size-1 probe, then one request per page
+        calls = [call.kwargs["params"] for call in toolset.execute_action.call_args_list]
+        assert calls[0]["max_results"] == 1
+        assert sorted(params["start_at"] for params in calls[1:]) == [0, 100, 200]
+        assert [params["max_results"] for params in sorted(calls[1:], key=lambda p: p["start_at"])] == [100, 100, 50]
+
+        values = result["data"]["details"]["values"]
+        ids = [user["accountId"] for user in values]
+        assert ids == [str(i) for i in range(250)]
+        assert len(set(ids)) == len(ids)
+
+    def test_execute_paged_falls_back_for_bare_list(self, component_class, default_kwargs):
+        component = component_class(**default_kwargs)
+        toolset = MagicMock()
+        toolset.execute_action.return_value = {"successful": True, "data": {"details": [{"accountId": "1"}]}}
+
+        result = component._execute_paged(
+            toolset, "JIRA_FIND_USERS", "JIRA_FIND_USERS", {"max_results": 250, "start_at": 0}
+        )
+
+        assert result["data"]["details"] == [{"accountId": "1"}]
+        # Probe plus a single unpaged request
+        assert toolset.execute_action.call_count == 2
+
+    def test_search_issues_is_not_paged(self, component_class, default_kwargs, monkeypatch):
+        monkeypatch.setattr(Action, "JIRA_SEARCH_ISSUES", "JIRA_SEARCH_ISSUES", raising=False)
+        component = component_class(**default_kwargs)
+        component.api_key = "test_key"
+        component.action = [{"name": "Search Issues"}]
+        component.JIRA_SEARCH_ISSUES_jql = "project = TEST"
+        component.JIRA_SEARCH_ISSUES_max_results = 250
+        toolset = MagicMock()
+        toolset.execute_action.return_value = {"successful": True, "data": {"details": {"issues": []}}}
+
+        with patch.object(component, "_build_wrapper", return_value=toolset):
+            component.execute_action()
+
+        toolset.execute_action.assert_called_once()
+        assert toolset.execute_action.call_args.kwargs["params"]["max_results"] == 250
+
+    @pytest.fixture
+    def projects_component(self, component_class, default_kwargs, monkeypatch):
+        monkeypatch.setattr(Action, "JIRA_GET_ALL_PROJECTS", "JIRA_GET_ALL_PROJECTS", raising=False)
+        component_class._metadata_cache.clear()
+        component = component_class(**default_kwargs)
+        component.api_key = "secret-api-key"
+        component.action = [{"name": "Get All Projects"}]
+        yield component
+        component_class._metadata_cache.clear()
+
+    def test_metadata_cache_serves_repeat_reads(self, projects_component):
+        toolset = MagicMock()
+        toolset.execute_action.return_value = {"successful": True, "data": {"values": [{"key": "TEST"}]}}
+
+        with patch.object(projects_component, "_build_wrapper", return_value=toolset):
+            first = projects_component.execute_action()
+            second = projects_component.execute_action()
+
+        assert first == second == {"values": [{"key": "TEST"}]}
+        toolset.execute_action.assert_called_once()
+
+    def test_metadata_cache_is_isolated_from_caller_mutation(self, projects_component):
+        toolset = MagicMock()
+        toolset.execute_action.return_value = {"successful": True, "data": {"values": [{"key": "TEST"}]}}
+
+        with patch.object(projects_component, "_build_wrapper", return_value=toolset):
+            # Mutating the result of a miss must not reach the stored entry
+            first = projects_component.execute_action()
+            first["values"].append({"key": "MUTATED"})
+            # Nor may mutating the result of a hit
+            second = projects_component.execute_action()
+            second["values"][0]["key"] = "CHANGED"
+            third = projects_component.execute_action()
+
+        assert third == {"values": [{"key": "TEST"}]}
+
+    def test_metadata_cache_key_does_not_contain_api_key(self, projects_component):
+        cache_key = projects_component._get_cache_key("JIRA_GET_ALL_PROJECTS", {})
+
+        assert "secret-api-key" not in cache_key
+        assert cache_key == projects_component._get_cache_key("JIRA_GET_ALL_PROJECTS", {})
+        projects_component.api_key = "other-api-key"
+        assert cache_key != projects_component._get_cache_key("JIRA_GET_ALL_PROJECTS", {})
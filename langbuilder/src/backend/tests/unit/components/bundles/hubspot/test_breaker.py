@@ -0,0 +1,125 @@
+import httpx
+import pytest
+from langbuilder.components.hubspot import _breaker
+from langbuilder.components.hubspot._breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from langbuilder.components.hubspot._client import _RetryTransport
+
+HOST = "api.hubapi.com"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(_breaker.time, "monotonic", fake_clock)
+    return fake_clock
+
+
+@pytest.fixture(autouse=True)
+def reset_breakers():
+    _breaker._breakers.clear()
+    yield
+    _breaker._breakers.clear()
+
+
+def test_breaker_opens_after_threshold_failures(clock):  # noqa: ARG001
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30.0)
+
+    for _ in range(2):
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+
+
+def test_breaker_success_resets_failure_count(clock):  # noqa: ARG001
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_breaker_half_open_lets_one_probe_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+    breaker.record_failure()
+
+    clock.now += 29.0
+    assert not breaker.allow_request()
+
+    clock.now += 1.0
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    # Only one probe while it is in flight
+    assert not breaker.allow_request()
+
+
+def test_breaker_probe_outcome_closes_or_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+    breaker.record_failure()
+
+    clock.now += 30.0
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+
+    clock.now += 30.0
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+
+def test_get_breaker_is_shared_per_host():
+    assert _breaker.get_breaker(HOST) is _breaker.get_breaker(HOST)
+    assert _breaker.get_breaker(HOST) is not _breaker.get_breaker("example.com")
+
+
+async def test_transport_raises_circuit_open_without_sending(clock):  # noqa: ARG001
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(503)
+
+    transport = _RetryTransport(httpx.MockTransport(handler), max_concurrency=1)
+    request = httpx.Request("POST", f"https://{HOST}/crm/v3/objects/notes")
+
+    # Non-retryable POST 503s count as failures until the breaker opens
+    for _ in range(_breaker.FAILURE_THRESHOLD):
+        response = await transport.handle_async_request(request)
+        assert response.status_code == 503
+    assert _breaker.get_breaker(HOST).state == OPEN
+
+    with pytest.raises(CircuitOpenError):
+        await transport.handle_async_request(request)
+    assert len(sent) == _breaker.FAILURE_THRESHOLD
+
+
+async def test_transport_records_transport_errors(clock):  # noqa: ARG001
+    def handler(request):
+        msg = "connection refused"
+        raise httpx.ConnectError(msg, request=request)
+
+    transport = _RetryTransport(httpx.MockTransport(handler), max_concurrency=1)
+    request = httpx.Request("GET", f"https://{HOST}/crm/v3/objects/contacts/1")
+
+    for _ in range(_breaker.FAILURE_THRESHOLD):
+        with pytest.raises(httpx.ConnectError):
+            await transport.handle_async_request(request)
+
+    with pytest.raises(CircuitOpenError):
+        await transport.handle_async_request(request)
@@ -0,0 +1,49 @@
+import pytest
+from langbuilder.components.hubspot import _cache
+from langbuilder.components.hubspot._cache import get_cached, make_key, set_cached
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    _cache._cache.clear()
+    yield
+    _cache._cache.clear()
+
+
+def test_make_key_does_not_contain_api_key():
+    key = make_key("secret-api-key", "contacts", 1)
+
+    assert "secret-api-key" not in repr(key)
+    assert key == make_key("secret-api-key", "contacts", "1")
+    assert key != make_key("other-api-key", "contacts", "1")
+
+
+def test_set_cached_ignores_non_positive_ttl():
+    key = make_key("key", "contacts", "1")
+    set_cached(key, {"id": "1"}, ttl=0)
+
+    assert get_cached(key) is None
+
+
+def test_stored_payload_is_isolated_from_caller_mutation():
+    key = make_key("key", "contacts", "1")
+    payload = {"contact": {"id": "1", "tags": ["a"]}}
+    set_cached(key, payload)
+
+    # The caller keeps using (and wrapping) the payload it cached
+    payload["contact"]["tags"].append("b")
+
+    assert get_cached(key) == {"contact": {"id": "1", "tags": ["a"]}}
+
+
+def test_every_hit_returns_a_fresh_copy():
+    key = make_key("key", "contacts", "1")
+    set_cached(key, {"contact": {"id": "1", "tags": ["a"]}})
+
+    first = get_cached(key)
+    first["contact"]["tags"].append("b")
+    first["query"] = "changed"
+    second = get_cached(key)
+
+    assert second is not first
+    assert second == {"contact": {"id": "1", "tags": ["a"]}}
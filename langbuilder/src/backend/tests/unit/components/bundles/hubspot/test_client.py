@@ -0,0 +1,98 @@
+import asyncio
+import gc
+import weakref
+
+import httpx
+from langbuilder.components.hubspot import _client
+from langbuilder.components.hubspot._client import (
+    MAX_RETRY_DELAY,
+    _retry_delay,
+    _RetryTransport,
+    aclose_client,
+    get_client,
+)
+
+
+async def test_get_client_reuses_client_within_loop():
+    client = get_client()
+    try:
+        assert get_client() is client
+    finally:
+        await aclose_client()
+
+
+async def test_aclose_client_closes_and_next_call_creates_new_client():
+    client = get_client()
+    await aclose_client()
+
+    assert client.is_closed
+    new_client = get_client()
+    try:
+        assert new_client is not client
+        assert not new_client.is_closed
+    finally:
+        await aclose_client()
+
+
+async def test_get_client_replaces_closed_client():
+    client = get_client()
+    await client.aclose()
+
+    new_client = get_client()
+    try:
+        assert new_client is not client
+    finally:
+        await aclose_client()
+
+
+def test_get_client_is_per_event_loop_and_does_not_pin_old_loops():
+    async def open_client():
+        return get_client()
+
+    first_loop = asyncio.new_event_loop()
+    first_client = first_loop.run_until_complete(open_client())
+    first_loop_ref = weakref.ref(first_loop)
+
+    second_loop = asyncio.new_event_loop()
+    try:
+        second_client = second_loop.run_until_complete(open_client())
+        assert second_client is not first_client
+        assert _client._clients.get(second_loop) is second_client
+    finally:
+        second_loop.run_until_complete(aclose_client())
+        second_loop.close()
+
+    first_loop.run_until_complete(first_client.aclose())
+    first_loop.close()
+    del first_loop, first_client
+    gc.collect()
+
+    # The registry must not keep a finished loop (and its client's pool) alive
+    assert first_loop_ref() is None
+
+
+def test_retry_delay_honours_retry_after_up_to_the_cap():
+    response = httpx.Response(429, headers={"Retry-After": "2"})
+
+    assert 2 <= _retry_delay(response, 1) <= MAX_RETRY_DELAY
+
+
+def test_retry_delay_above_the_cap_is_not_retried():
+    response = httpx.Response(429, headers={"Retry-After": str(MAX_RETRY_DELAY + 1)})
+
+    assert _retry_delay(response, 1) is None
+
+
+async def test_transport_returns_response_when_retry_after_exceeds_cap():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "3600"})
+
+    transport = _RetryTransport(httpx.MockTransport(handler), max_concurrency=1)
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.get("https://retry-after-cap.test/crm/v3/objects/contacts/1")
+
+    assert response.status_code == 429
+    assert len(calls) == 1
@@ -0,0 +1,107 @@
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+from langbuilder.components.hubspot.hubspot_contact_batch_fetcher import HubSpotContactBatchFetcher
+from langbuilder.schema import Data
+
+from tests.base import ComponentTestBaseWithoutClient
+
+MODULE = "langbuilder.components.hubspot.hubspot_contact_batch_fetcher"
+
+
+def make_batch_read_client(missing_ids: set[str] = frozenset()):
+    """Client whose /batch/read endpoint returns every requested contact except missing_ids."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/crm/v3/objects/contacts/batch/read"
+        body = json.loads(request.content)
+        requests.append(body)
+        ids = [item["id"] for item in body["inputs"]]
+        results = [{"id": i, "properties": {"firstname": f"First {i}"}} for i in ids if i not in missing_ids]
+        errors = [
+            {"status": "error", "category": "OBJECT_NOT_FOUND", "context": {"ids": [i]}}
+            for i in ids
+            if i in missing_ids
+        ]
+        status = 207 if errors else 200
+        return httpx.Response(status, json={"status": "COMPLETE", "results": results, "errors": errors})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, requests
+
+
+class TestHubSpotContactBatchFetcher(ComponentTestBaseWithoutClient):
+    @pytest.fixture(autouse=True)
+    def batch_read_requests(self):
+        client, requests = make_batch_read_client()
+        with patch(f"{MODULE}.get_client", return_value=client):
+            yield requests
+
+    @pytest.fixture
+    def component_class(self):
+        return HubSpotContactBatchFetcher
+
+    @pytest.fixture
+    def default_kwargs(self):
+        return {
+            "hubspot_api_key": "test-key",
+            "contact_ids": [Data(data={"contact_ids": [str(i) for i in range(250)]})],
+            "properties": "",
+        }
+
+    @pytest.fixture
+    def file_names_mapping(self):
+        return []
+
+    async def test_fetch_contacts_chunks_ids_above_batch_size(
+        self, component_class, default_kwargs, batch_read_requests
+    ):
+        component = component_class(**default_kwargs)
+
+        result = await component.fetch_contacts()
+
+        assert sorted(len(body["inputs"]) for body in batch_read_requests) == [50, 100, 100]
+        sent_ids = [item["id"] for body in batch_read_requests for item in body["inputs"]]
+        assert sorted(sent_ids, key=int) == [str(i) for i in range(250)]
+
+        assert result.data["success"] is True
+        assert result.data["contact_count"] == 250
+        assert result.data["requested_count"] == 250
+        assert result.data["errors"] == []
+
+    async def test_fetch_contacts_reports_missing_ids(self, component_class, default_kwargs):
+        client, _ = make_batch_read_client(missing_ids={"3", "150"})
+        component = component_class(**default_kwargs)
+
+        with patch(f"{MODULE}.get_client", return_value=client):
+            result = await component.fetch_contacts()
+
+        returned_ids = {contact["id"] for contact in result.data["contacts"]}
+        assert result.data["contact_count"] == 248
+        assert "3" not in returned_ids
+        assert "150" not in returned_ids
+        assert len(result.data["errors"]) == 2
+        # Found contacts still make the fetch a success
+        assert result.data["success"] is True
+
+    async def test_fetch_contacts_deduplicates_ids(self, component_class, batch_read_requests):
+        component = component_class(
+            hubspot_api_key="test-key",
+            contact_ids=[Data(data={"contact_id": "1"}), Data(data={"id": "1"}), Data(data={"contact_id": "2"})],
+        )
+
+        result = await component.fetch_contacts()
+
+        assert [item["id"] for item in batch_read_requests[0]["inputs"]] == ["1", "2"]
+        assert result.data["contact_count"] == 2
+
+    async def test_fetch_contacts_without_ids(self, component_class):
+        component = component_class(hubspot_api_key="test-key", contact_ids=[Data(data={})])
+
+        result = await component.fetch_contacts()
+
+        assert result.data["success"] is False
+        assert result.data["contacts"] == []
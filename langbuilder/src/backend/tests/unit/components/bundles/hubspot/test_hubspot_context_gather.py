@@ -0,0 +1,105 @@
+import json
+from unittest.mock import patch
+
+import httpx
+from langbuilder.components.hubspot.hubspot_context_gather import HubSpotContextGatherComponent
+from langbuilder.schema import Data
+
+MODULE = "langbuilder.components.hubspot.hubspot_context_gather"
+
+select_properties = HubSpotContextGatherComponent._select_properties
+USED = ("firstname", "lastname", "email")
+
+
+def test_select_properties_sends_everything_the_user_requested():
+    selected, dropped = select_properties("email, custom_score,firstname,email", "firstname,lastname", USED)
+
+    assert selected == ("email", "custom_score", "firstname")
+    assert dropped == ("custom_score",)
+
+
+def test_select_properties_trims_builtin_defaults_to_used_fields():
+    selected, dropped = select_properties("", "firstname,jobtitle,email", USED)
+
+    assert selected == ("firstname", "email")
+    assert dropped == ()
+
+
+def test_property_list_warns_on_every_run():
+    component = HubSpotContextGatherComponent(contact_properties="firstname,custom_score")
+
+    with patch(f"{MODULE}.logger") as logger:
+        assert component._contact_property_list() == ("firstname", "custom_score")
+        assert component._contact_property_list() == ("firstname", "custom_score")
+
+    assert logger.warning.call_count == 2
+    assert "custom_score" in logger.warning.call_args.args[0]
+
+
+ASSOCIATIONS = {"1": ["10", "11"], "2": ["11", "12"], "3": []}
+
+
+def make_gather_client():
+    """Client serving the contact, association and company batch read endpoints."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = [item["id"] for item in json.loads(request.content)["inputs"]]
+        requests.append((request.url.path, ids))
+        if request.url.path == "/crm/v3/objects/contacts/batch/read":
+            results = [{"id": i, "properties": {"firstname": f"First {i}"}} for i in ids]
+        elif request.url.path == "/crm/v3/associations/contacts/companies/batch/read":
+            results = [
+                {"from": {"id": i}, "to": [{"id": cid} for cid in ASSOCIATIONS[i]]} for i in ids if ASSOCIATIONS[i]
+            ]
+        else:
+            assert request.url.path == "/crm/v3/objects/companies/batch/read"
+            results = [{"id": i, "properties": {"name": f"Company {i}"}} for i in ids]
+        return httpx.Response(200, json={"status": "COMPLETE", "results": results})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+
+
+def make_component(api_key: str, *, cache_ttl: int = 0) -> HubSpotContextGatherComponent:
+    return HubSpotContextGatherComponent(
+        contact_input=Data(data={"contact_ids": list(ASSOCIATIONS)}),
+        hubspot_api_key=api_key,
+        contact_properties="",
+        company_properties="",
+        include_all_companies=True,
+        cache_ttl=cache_ttl,
+        company_cache_ttl=0,
+        base_url="https://api.hubapi.com",
+    )
+
+
+async def test_gather_batch_includes_all_associated_companies():
+    client, requests = make_gather_client()
+
+    with patch(f"{MODULE}.get_client", return_value=client):
+        result = await make_component("all-companies-key").gather_context()
+
+    company_reads = [ids for path, ids in requests if path == "/crm/v3/objects/companies/batch/read"]
+    assert company_reads == [["10", "11", "12"]]
+
+    contexts = {c["contact_id"]: c for c in result.data["contacts"]}
+    assert contexts["1"]["company"]["name"] == "Company 10"
+    assert contexts["1"]["associated_companies"] == [
+        {"id": "10", "name": "Company 10"},
+        {"id": "11", "name": "Company 11"},
+    ]
+    assert [c["id"] for c in contexts["2"]["associated_companies"]] == ["11", "12"]
+    assert contexts["3"]["company_id"] is None
+    assert contexts["3"]["associated_companies"] == []
+
+
+async def test_gather_batch_serves_cached_contexts():
+    client, requests = make_gather_client()
+
+    with patch(f"{MODULE}.get_client", return_value=client):
+        first = await make_component("batch-cache-key", cache_ttl=60).gather_context()
+        requests.clear()
+        second = await make_component("batch-cache-key", cache_ttl=60).gather_context()
+
+    assert requests == []
+    assert second.data == first.data
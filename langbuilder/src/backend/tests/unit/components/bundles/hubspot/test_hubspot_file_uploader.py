@@ -0,0 +1,46 @@
+import base64
+import binascii
+
+import pytest
+from langbuilder.components.hubspot.hubspot_file_uploader import HubSpotFileUploader
+
+PDF_BYTES = b"%PDF-1.7\n" + bytes(range(256)) * 3
+
+
+@pytest.fixture
+def uploader(monkeypatch):
+    # Small chunks so the test input spans many chunk boundaries
+    monkeypatch.setattr(HubSpotFileUploader, "DECODE_CHUNK_CHARS", 7)
+    return HubSpotFileUploader()
+
+
+def test_decode_to_spool_strips_whitespace_across_chunks(uploader):
+    encoded = base64.encodebytes(PDF_BYTES).decode()  # wrapped at 76 characters
+    encoded = " ".join(encoded[i : i + 5] for i in range(0, len(encoded), 5))
+
+    with uploader._decode_to_spool(encoded) as spool:
+        spool.seek(0)
+        assert spool.read() == PDF_BYTES
+
+
+def test_validate_base64_accepts_wrapped_input(uploader):
+    uploader._validate_base64(base64.encodebytes(PDF_BYTES).decode())
+
+
+def test_validate_base64_rejects_truncated_input(uploader):
+    encoded = base64.encodebytes(PDF_BYTES).decode()
+
+    with pytest.raises(ValueError, match="multiple of 4"):
+        uploader._validate_base64(encoded[:-2])
+
+
+def test_validate_base64_rejects_oversized_input(uploader, monkeypatch):
+    monkeypatch.setattr(HubSpotFileUploader, "MAX_PDF_BYTES", len(PDF_BYTES) - 1)
+
+    with pytest.raises(ValueError, match="upload limit"):
+        uploader._validate_base64(base64.encodebytes(PDF_BYTES).decode())
+
+
+def test_decode_to_spool_rejects_invalid_characters(uploader):
+    with pytest.raises(binascii.Error):
+        uploader._decode_to_spool("QU!D")